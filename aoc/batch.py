@@ -0,0 +1,146 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Iterable, Iterator
+
+from aoc.runner import Answer, load_solution
+
+# Hand each worker several inputs at a time so tiny inputs are not dominated
+# by inter-process overhead, while still balancing the load across workers
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    input_path: str
+    answers: list[Answer] | None
+    parse_seconds: float
+    solve_seconds: float
+    error: str | None = None
+
+
+def get_input_paths(path: str) -> list[str]:
+    """List the inputs in a directory, or in a manifest file (or stdin for "-")
+    of one path per line, relative to the manifest. Blank lines and lines
+    starting with # are ignored."""
+    if os.path.isdir(path):
+        return sorted(
+            os.path.join(path, name)
+            for name in os.listdir(path)
+            if not name.startswith(".") and os.path.isfile(os.path.join(path, name))
+        )
+
+    if path == "-":
+        lines, directory = list(sys.stdin), ""
+    else:
+        with open(path) as f:
+            lines, directory = list(f), os.path.dirname(path)
+    return [
+        os.path.join(directory, line.strip())
+        for line in lines
+        if line.strip() and not line.startswith("#")
+    ]
+
+
+def solve_input(day: int, input_path: str) -> BatchResult:
+    """Parse once and solve both parts. The solution module is imported once
+    per process, so compiled patterns, lookup tables and the neighbour tables
+    of recently seen grid shapes are reused across inputs."""
+    solution = load_solution(day)
+    try:
+        start = time.perf_counter()
+        with open(input_path) as f:
+            parsed = solution.parse_input(f)
+        parse_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if hasattr(solution, "solve"):
+            answers = list(solution.solve(parsed))
+        else:
+            answers = [solution.part_one(parsed), solution.part_two(parsed)]
+        solve_seconds = time.perf_counter() - start
+    except Exception as e:
+        # One malformed input should not abort the rest of the batch
+        return BatchResult(input_path, None, 0, 0, f"{type(e).__name__}: {e}")
+    return BatchResult(input_path, answers, parse_seconds, solve_seconds)
+
+
+def solve_batch(
+    day: int,
+    input_paths: Iterable[str],
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+) -> Iterator[BatchResult]:
+    """Solve every input for a day across a pool of worker processes, yielding
+    results in input order as soon as they are available."""
+    input_paths = list(input_paths)
+    if max_workers == 1:
+        for input_path in input_paths:
+            yield solve_input(day, input_path)
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(input_paths) // (max_workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=load_solution, initargs=(day,)
+    ) as executor:
+        yield from executor.map(
+            partial(solve_input, day), input_paths, chunksize=chunksize
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Solve many inputs for one day across a pool of worker "
+        "processes, writing a JSON line per input."
+    )
+    parser.add_argument("day", type=int, help="day to solve")
+    parser.add_argument(
+        "inputs",
+        help="directory of inputs, or a manifest file listing one input path "
+        'per line ("-" reads the manifest from stdin)',
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes (defaults to the number of cores, "
+        "1 solves in this process)",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        help="number of inputs handed to a worker at a time "
+        "(defaults to spreading each worker's share over a few chunks)",
+    )
+    parser.add_argument(
+        "-o", "--output", help="write the JSON lines to this path (defaults to stdout)"
+    )
+    args = parser.parse_args()
+
+    input_paths = get_input_paths(args.inputs)
+    output = open(args.output, "w") if args.output else sys.stdout
+    failures = 0
+    try:
+        for result in solve_batch(args.day, input_paths, args.workers, args.chunksize):
+            failures += result.error is not None
+            output.write(json.dumps({"day": args.day, **asdict(result)}) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if failures:
+        print(f"{failures} of {len(input_paths)} inputs failed", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from multiprocessing.connection import Connection
+
+from aoc.generators import FIXED_SIZE_DAYS, write_input
+from aoc.runner import ROOT, discover_days, get_tasks, run_parts
+
+DEFAULT_BASELINE_PATH = os.path.join(ROOT, "bench_baseline.json")
+DEFAULT_SCALES = [1, 10, 100]
+
+# Differences below these are treated as noise rather than regressions
+MIN_SECONDS_DIFFERENCE = 0.01
+MIN_PEAK_BYTES_DIFFERENCE = 64 * 1024
+
+# Importing any single solution should stay within this, with warm bytecode
+DEFAULT_IMPORT_BUDGET_SECONDS = 0.025
+IMPORT_TIME_RUNS = 5
+IMPORT_TIME_TOP_IMPORTS = 3
+
+
+@dataclass(frozen=True)
+class Measurement:
+    day: int
+    parts: list[int]
+    scale: int
+    status: str
+    seconds: float | None = None
+    peak_bytes: int | None = None
+    # The status of the separate memory pass, if it was run
+    memory_status: str | None = None
+
+    def key(self) -> tuple[int, tuple[int, ...], int]:
+        return self.day, tuple(self.parts), self.scale
+
+
+def measure(
+    connection: Connection,
+    day: int,
+    parts: tuple[int, ...],
+    input_path: str,
+    trace_memory: bool,
+) -> None:
+    """Run the parts once in this (fresh) process and send back either the
+    parse and solve time or, when tracing memory, the peak traced memory."""
+    try:
+        if trace_memory:
+            tracemalloc.start()
+        # Each task is either a single part or both parts solved together
+        result = run_parts(day, parts, input_path)[0]
+        if trace_memory:
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            connection.send(("ok", peak_bytes))
+        else:
+            connection.send(("ok", result.parse_seconds + result.solve_seconds))
+    except Exception as e:
+        connection.send((f"error: {e!r}", None))
+    finally:
+        connection.close()
+
+
+def run_measurement(
+    day: int,
+    parts: tuple[int, ...],
+    input_path: str,
+    trace_memory: bool,
+    timeout: float,
+) -> tuple[str, float | int | None]:
+    # Each measurement gets a fresh interpreter so that module level caches
+    # (e.g. day21's memoized wins) do not leak between runs.
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=measure, args=(sender, day, parts, input_path, trace_memory)
+    )
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            process.terminate()
+            return "timeout", None
+        return receiver.recv()
+    except EOFError:
+        process.join()
+        return f"error: exit code {process.exitcode}", None
+    finally:
+        process.join()
+        receiver.close()
+
+
+def run_benchmarks(
+    days: list[int],
+    scales: list[int],
+    seed: int,
+    timeout: float,
+    trace_memory: bool,
+) -> list[Measurement]:
+    measurements = []
+    with tempfile.TemporaryDirectory() as directory:
+        for day in days:
+            for scale in scales:
+                if scale != 1 and day in FIXED_SIZE_DAYS:
+                    continue
+                input_path = write_input(directory, day, scale, seed)
+                for parts in get_tasks(day):
+                    status, seconds = run_measurement(
+                        day, parts, input_path, False, timeout
+                    )
+                    memory_status, peak_bytes = None, None
+                    if status == "ok" and trace_memory:
+                        # Tracing is slower, so it may fail where timing did not
+                        memory_status, peak_bytes = run_measurement(
+                            day, parts, input_path, True, timeout
+                        )
+                    measurement = Measurement(
+                        day=day,
+                        parts=list(parts),
+                        scale=scale,
+                        status=status,
+                        seconds=seconds,
+                        peak_bytes=None if peak_bytes is None else int(peak_bytes),
+                        memory_status=memory_status,
+                    )
+                    print(format_measurement(measurement), flush=True)
+                    measurements.append(measurement)
+    return measurements
+
+
+def measure_import_time(
+    day: int, bytecode_directory: str
+) -> tuple[float, list[tuple[str, float]]]:
+    """Import the solution in fresh interpreters with -X importtime and return
+    the fastest cumulative import time along with that run's direct imports,
+    slowest first. Bytecode is compiled into bytecode_directory by a warm-up
+    import so only importing is timed."""
+    module = f"day{day}.solution{day}"
+    environment = dict(os.environ, PYTHONPYCACHEPREFIX=bytecode_directory)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+
+    best: tuple[float, list[tuple[str, float]]] | None = None
+    for _ in range(IMPORT_TIME_RUNS + 1):
+        completed = subprocess.run(
+            command, cwd=ROOT, env=environment, capture_output=True, text=True
+        )
+        completed.check_returncode()
+        import_time = parse_import_times(completed.stderr, module)
+        if best is None or import_time[0] < best[0]:
+            best = import_time
+    assert best is not None
+    return best
+
+
+def parse_import_times(
+    stderr: str, module: str
+) -> tuple[float, list[tuple[str, float]]]:
+    """Parse -X importtime output (in which each module's imports are listed
+    before it, indented one level deeper) into the module's cumulative time and
+    its direct imports' cumulative times."""
+    imports: list[tuple[str, float]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            # Column headers
+            continue
+        seconds = int(cumulative) / 1_000_000
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 0:
+            if name.strip() == module:
+                imports.sort(key=lambda item: item[1], reverse=True)
+                return seconds, imports
+            imports = []
+        elif depth == 1:
+            imports.append((name.strip(), seconds))
+    raise ValueError(f"Expected {module} in the import times")
+
+
+def run_import_report(days: list[int], budget: float) -> list[str]:
+    """Print each solution's import time and heaviest imports, returning the
+    solutions over budget."""
+    over_budget = []
+    with tempfile.TemporaryDirectory() as bytecode_directory:
+        for day in days:
+            seconds, imports = measure_import_time(day, bytecode_directory)
+            heaviest = ", ".join(
+                f"{name} {import_seconds * 1000:.1f}ms"
+                for name, import_seconds in imports[:IMPORT_TIME_TOP_IMPORTS]
+            )
+            line = f"Day {day} import: {seconds * 1000:.1f}ms"
+            if heaviest:
+                line += f" ({heaviest})"
+            print(line, flush=True)
+            if seconds > budget:
+                over_budget.append(f"Day {day}: {seconds * 1000:.1f}ms")
+    return over_budget
+
+
+def find_regressions(
+    measurements: list[Measurement],
+    baseline: list[Measurement],
+    tolerance: float,
+) -> list[str]:
+    baseline_by_key = {measurement.key(): measurement for measurement in baseline}
+    regressions = []
+    for measurement in measurements:
+        previous = baseline_by_key.get(measurement.key())
+        if previous is None or previous.status != "ok":
+            continue
+        label = format_label(measurement)
+        if measurement.status != "ok":
+            regressions.append(f"{label}: {measurement.status} (was ok)")
+            continue
+        if measurement.memory_status not in (None, "ok") and previous.peak_bytes:
+            regressions.append(
+                f"{label}: peak memory {measurement.memory_status} (was ok)"
+            )
+        for name, current_value, previous_value, min_difference in (
+            ("time", measurement.seconds, previous.seconds, MIN_SECONDS_DIFFERENCE),
+            (
+                "peak memory",
+                measurement.peak_bytes,
+                previous.peak_bytes,
+                MIN_PEAK_BYTES_DIFFERENCE,
+            ),
+        ):
+            if current_value is None or previous_value is None:
+                continue
+            if (
+                current_value > previous_value * (1 + tolerance)
+                and current_value - previous_value > min_difference
+            ):
+                change = (current_value - previous_value) / previous_value
+                regressions.append(f"{label}: {name} +{change:.0%}")
+    return regressions
+
+
+def load_baseline(path: str) -> list[Measurement]:
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [Measurement(**measurement) for measurement in json.load(f)["results"]]
+
+
+def save_baseline(
+    path: str,
+    measurements: list[Measurement],
+    baseline: list[Measurement],
+    seed: int,
+) -> None:
+    # Keep the previous results for anything which was not re-measured
+    measurements_by_key = {measurement.key(): measurement for measurement in baseline}
+    measurements_by_key.update(
+        (measurement.key(), measurement) for measurement in measurements
+    )
+    measurements = sorted(measurements_by_key.values(), key=Measurement.key)
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "seed": seed,
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "results": [asdict(measurement) for measurement in measurements],
+            },
+            f,
+            indent=2,
+        )
+        f.write("\n")
+
+
+def format_label(measurement: Measurement) -> str:
+    parts = " & ".join(
+        "Part One" if part == 1 else "Part Two" for part in measurement.parts
+    )
+    return f"Day {measurement.day} {parts} x{measurement.scale}"
+
+
+def format_measurement(measurement: Measurement) -> str:
+    label = format_label(measurement)
+    if measurement.status != "ok":
+        return f"{label}: {measurement.status}"
+    line = f"{label}: {measurement.seconds:.3f}s"
+    if measurement.peak_bytes is not None:
+        line += f", peak {measurement.peak_bytes / 1024 / 1024:.1f} MiB"
+    elif measurement.memory_status not in (None, "ok"):
+        line += f", peak memory {measurement.memory_status}"
+    return line
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark each day on seeded synthetic inputs of growing size."
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=int,
+        help="days to benchmark (defaults to every discovered day)",
+    )
+    parser.add_argument(
+        "-s",
+        "--scales",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SCALES,
+        help="input size multipliers relative to the puzzle input",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60,
+        help="seconds before a single measurement is abandoned",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="relative slowdown or memory growth reported as a regression",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip the (slower) peak memory measurement",
+    )
+    parser.add_argument(
+        "--imports",
+        action="store_true",
+        help="report each solution's import time (from -X importtime) and check "
+        "it against --import-budget instead of benchmarking",
+    )
+    parser.add_argument(
+        "--import-budget",
+        type=float,
+        default=DEFAULT_IMPORT_BUDGET_SECONDS,
+        help="seconds any single solution may take to import",
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="write the new baseline even if it has regressions",
+    )
+    parser.add_argument(
+        "--output",
+        help="where to write the new baseline (defaults to --baseline)",
+    )
+    args = parser.parse_args()
+
+    days = args.days or discover_days()
+    if args.imports:
+        over_budget = run_import_report(days, args.import_budget)
+        if over_budget:
+            budget_ms = args.import_budget * 1000
+            print(f"{len(over_budget)} solution(s) over the {budget_ms:.0f}ms budget:")
+            for line in over_budget:
+                print(f"  {line}")
+            sys.exit(1)
+        return
+
+    baseline = load_baseline(args.baseline)
+    measurements = run_benchmarks(
+        days, args.scales, args.seed, args.timeout, not args.no_memory
+    )
+    regressions = find_regressions(measurements, baseline, args.tolerance)
+    # Regressions are kept out of the baseline unless accepted explicitly, so
+    # they keep being reported rather than becoming the new normal
+    if not regressions or args.update_baseline:
+        save_baseline(args.output or args.baseline, measurements, baseline, args.seed)
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) against the previous baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        if not args.update_baseline:
+            print("The baseline was not updated; pass --update-baseline to accept them")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from functools import cache
+from typing import Any
+
+DEFAULT_CACHE_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".aoc_cache"
+)
+DEFAULT_MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+MISSING = object()
+
+
+def hash_file(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@cache
+def hash_package() -> str:
+    """Hash the source of every aoc module, which solutions share."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith(".py"):
+            digest.update(filename.encode())
+            digest.update(hash_file(os.path.join(directory, filename)).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """On-disk cache of parsed inputs and answers.
+
+    Entries are keyed by the hash of the input, the hash of the solution source,
+    the hash of the aoc package it imports and the entry name (e.g. "parse" or
+    "part1") so editing any of them invalidates them. Entries which no longer
+    unpickle, e.g. because a class they hold has changed, are misses. The least
+    recently used entries are evicted once the cache grows beyond its size
+    limit."""
+
+    def __init__(
+        self, directory: str | None = None, max_bytes: int | None = None
+    ) -> None:
+        self.directory = directory or os.environ.get(
+            "AOC_CACHE_DIR", DEFAULT_CACHE_DIRECTORY
+        )
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(os.environ.get("AOC_CACHE_MAX_BYTES", DEFAULT_MAX_CACHE_BYTES))
+        )
+
+    def make_key(self, input_path: str, solution_path: str) -> str:
+        return f"{hash_file(input_path)}-{hash_file(solution_path)}-{hash_package()}"
+
+    def get_path(self, key: str, entry: str) -> str:
+        name = hashlib.sha256(f"{key}-{entry}".encode()).hexdigest()
+        return os.path.join(self.directory, name[:2], f"{name}.pickle")
+
+    def get(self, key: str, entry: str) -> Any:
+        path = self.get_path(key, entry)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return MISSING
+        # Touch the entry so eviction treats it as recently used
+        os.utime(path)
+        return value
+
+    def set(self, key: str, entry: str, value: Any) -> None:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Not everything a solution parses can be pickled
+            return
+        if len(data) > self.max_bytes:
+            return
+        path = self.get_path(key, entry)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write atomically as several workers may share the cache
+        fd, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temporary_path, path)
+
+    def evict(self) -> None:
+        entries = []
+        for directory, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            os.remove(path)
+            total_bytes -= size
@@ -0,0 +1,429 @@
+import itertools
+import math
+import os
+import random
+from typing import Callable
+
+from aoc.grid import Grid
+from aoc.runner import get_input_path
+
+InputGenerator = Callable[[random.Random, int], str]
+
+# Days whose solutions (or puzzles) are tied to a fixed input size. Their
+# generators produce fresh random inputs but ignore the scale.
+FIXED_SIZE_DAYS = set([11, 12, 21, 23, 24])
+
+SEVEN_SEGMENT_DIGITS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+OPEN_CHUNK_TO_CLOSE_CHUNK = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def scale_side(base_side: int, scale: int) -> int:
+    """Scale the side of a square grid so that its area grows with the scale."""
+    return max(1, round(base_side * math.sqrt(scale)))
+
+
+def format_digit_grid(
+    rng: random.Random, m: int, n: int, digits: str = "0123456789"
+) -> str:
+    return "\n".join("".join(rng.choices(digits, k=n)) for _ in range(m)) + "\n"
+
+
+def generate_day1(rng: random.Random, scale: int) -> str:
+    depth = rng.randint(100, 200)
+    depths = []
+    for _ in range(2000 * scale):
+        depth = max(0, depth + rng.randint(-10, 20))
+        depths.append(depth)
+    return "\n".join(str(depth) for depth in depths) + "\n"
+
+
+def generate_day2(rng: random.Random, scale: int) -> str:
+    directions = rng.choices(["forward", "down", "up"], [4, 4, 3], k=1000 * scale)
+    return "\n".join(f"{d} {rng.randint(1, 9)}" for d in directions) + "\n"
+
+
+def generate_day3(rng: random.Random, scale: int) -> str:
+    from day3.solution3 import Report, part_two
+
+    count = 1000 * scale
+    # The ratings need distinct numbers, so the puzzle's 12 bits are widened to
+    # leave at least twice as many values as numbers at larger scales
+    width = max(12, count.bit_length() + 1)
+    # Not every report narrows both ratings down to one number so retry until
+    # one does
+    while True:
+        numbers = rng.sample(range(2**width), count)
+        try:
+            part_two(Report(numbers, width))
+        except ValueError:
+            continue
+        return "\n".join(f"{number:0{width}b}" for number in numbers) + "\n"
+
+
+def generate_day4(rng: random.Random, scale: int) -> str:
+    lines = [",".join(str(x) for x in rng.sample(range(100), 100))]
+    for _ in range(100 * scale):
+        board = rng.sample(range(100), 25)
+        lines.append("")
+        for i in range(5):
+            lines.append(" ".join(f"{x:>2}" for x in board[5 * i : 5 * i + 5]))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day5(rng: random.Random, scale: int) -> str:
+    lines: list[str] = []
+    while len(lines) < 500 * scale:
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        length = rng.randint(1, 300)
+        kind = rng.randrange(3)
+        dx = rng.choice([-1, 1]) if kind != 1 else 0
+        dy = rng.choice([-1, 1]) if kind != 0 else 0
+        x2, y2 = x1 + dx * length, y1 + dy * length
+        if 0 <= x2 < 1000 and 0 <= y2 < 1000:
+            lines.append(f"{x1},{y1} -> {x2},{y2}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day6(rng: random.Random, scale: int) -> str:
+    return ",".join(str(rng.randint(1, 5)) for _ in range(300 * scale)) + "\n"
+
+
+def generate_day7(rng: random.Random, scale: int) -> str:
+    positions = (int(rng.expovariate(1 / 400)) for _ in range(1000 * scale))
+    return ",".join(str(min(position, 2000)) for position in positions) + "\n"
+
+
+def generate_day8(rng: random.Random, scale: int) -> str:
+    lines = []
+    for _ in range(200 * scale):
+        wires = rng.sample("abcdefg", 7)
+        wiring = dict(zip("abcdefg", wires))
+
+        def scramble(digit: int) -> str:
+            segments = [wiring[c] for c in SEVEN_SEGMENT_DIGITS[digit]]
+            return "".join(rng.sample(segments, len(segments)))
+
+        signal_patterns = [scramble(digit) for digit in rng.sample(range(10), 10)]
+        output_patterns = [scramble(rng.randrange(10)) for _ in range(4)]
+        lines.append(f"{' '.join(signal_patterns)} | {' '.join(output_patterns)}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day9(rng: random.Random, scale: int) -> str:
+    side = scale_side(100, scale)
+    return format_digit_grid(rng, side, side)
+
+
+def generate_day10(rng: random.Random, scale: int) -> str:
+    lines = []
+    for _ in range(100 * scale):
+        open_chunks: list[str] = []
+        line: list[str] = []
+        for _ in range(rng.randint(20, 110)):
+            if open_chunks and rng.random() < 0.4:
+                line.append(OPEN_CHUNK_TO_CLOSE_CHUNK[open_chunks.pop()])
+            else:
+                open_chunk = rng.choice("([{<")
+                open_chunks.append(open_chunk)
+                line.append(open_chunk)
+        if not open_chunks:
+            open_chunks.append("(")
+            line.append("(")
+        if rng.random() < 0.5:
+            # Corrupt the line with a mismatched closing character
+            expected = OPEN_CHUNK_TO_CLOSE_CHUNK[open_chunks[-1]]
+            line.append(rng.choice([c for c in ")]}>" if c != expected]))
+        lines.append("".join(line))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day11(rng: random.Random, scale: int) -> str:
+    from day11.solution11 import is_synchronized, step
+
+    # Not every grid eventually synchronizes so retry until one does
+    while True:
+        grid = format_digit_grid(rng, 10, 10)
+        energy_levels = Grid.from_lines(grid.split())
+        for _ in range(1000):
+            if is_synchronized(energy_levels):
+                return grid
+            step(energy_levels)
+
+
+def generate_day12(rng: random.Random, scale: int) -> str:
+    # Big caves are never connected to each other otherwise there would be
+    # infinitely many paths.
+    big_caves = ["AB", "CD", "EF"]
+    small_caves = ["start", "end", "gh", "ij", "kl", "mn", "op", "qr"]
+    edges: set[tuple[str, str]] = set()
+    while len(edges) < 20:
+        v1, v2 = rng.sample(big_caves + small_caves, 2)
+        if v1.isupper() and v2.isupper():
+            continue
+        edges.add((min(v1, v2), max(v1, v2)))
+    return "\n".join(f"{v1}-{v2}" for v1, v2 in sorted(edges)) + "\n"
+
+
+def generate_day13(rng: random.Random, scale: int) -> str:
+    # Unfold a 40x6 code area back out, always doubling the smaller side,
+    # until the paper is at least the size of the puzzle paper times the scale.
+    width, height = 40, 6
+    unfolds: list[str] = []
+    while width * height < 1311 * 895 * scale:
+        if width <= height:
+            unfolds.append(f"fold along x={width}")
+            width = 2 * width + 1
+        else:
+            unfolds.append(f"fold along y={height}")
+            height = 2 * height + 1
+
+    dots = set([(width - 1, 0), (0, height - 1)])
+    while len(dots) < 800 * scale:
+        dots.add((rng.randrange(width), rng.randrange(height)))
+    lines = [f"{x},{y}" for x, y in dots]
+    return "\n".join(lines + [""] + unfolds[::-1]) + "\n"
+
+
+def generate_day14(rng: random.Random, scale: int) -> str:
+    elements = "BCFHKNOPSV"
+    template = "".join(rng.choices(elements, k=20 * scale))
+    rules = [
+        f"{a}{b} -> {rng.choice(elements)}"
+        for a, b in itertools.product(elements, repeat=2)
+    ]
+    return "\n".join([template, ""] + rules) + "\n"
+
+
+def generate_day15(rng: random.Random, scale: int) -> str:
+    side = scale_side(100, scale)
+    return format_digit_grid(rng, side, side, digits="123456789")
+
+
+def generate_day16(rng: random.Random, scale: int) -> str:
+    def encode_literal(value: int) -> str:
+        bits = f"{value:b}"
+        bits = bits.zfill(-(-len(bits) // 4) * 4)
+        groups = [bits[i : i + 4] for i in range(0, len(bits), 4)]
+        return "".join(
+            ("0" if i == len(groups) - 1 else "1") + group
+            for i, group in enumerate(groups)
+        )
+
+    def encode_operator(type_id: int, subpackets: list[str]) -> str:
+        header = f"{rng.randrange(8):03b}{type_id:03b}"
+        bits = "".join(subpackets)
+        if len(bits) < 2**15 and (len(subpackets) >= 2**11 or rng.random() < 0.5):
+            return header + "0" + f"{len(bits):015b}" + bits
+        return header + "1" + f"{len(subpackets):011b}" + bits
+
+    def generate_packet(depth: int) -> str:
+        if depth >= 4 or rng.random() < 0.4:
+            header = f"{rng.randrange(8):03b}100"
+            return header + encode_literal(rng.randrange(2 ** rng.randint(1, 20)))
+        type_id = rng.choice([0, 1, 2, 3, 5, 6, 7])
+        count = 2 if type_id >= 5 else rng.randint(1, 4)
+        return encode_operator(
+            type_id, [generate_packet(depth + 1) for _ in range(count)]
+        )
+
+    # Group the top level packets so every operator stays within the limits
+    # of the length type encodings.
+    packets = [generate_packet(1) for _ in range(50 * scale)]
+    while len(packets) > 1:
+        packets = [
+            encode_operator(0, packets[i : i + 1000])
+            for i in range(0, len(packets), 1000)
+        ]
+    bits = packets[0]
+    bits = bits.ljust(-(-len(bits) // 4) * 4, "0")
+    return f"{int('1' + bits, 2):X}"[1:] + "\n"
+
+
+def generate_day17(rng: random.Random, scale: int) -> str:
+    k = math.sqrt(scale)
+    min_x = round(rng.randint(150, 250) * k)
+    max_x = min_x + round(rng.randint(30, 60) * k)
+    min_y = -round(rng.randint(80, 150) * k)
+    max_y = min_y + round(rng.randint(20, 50) * k)
+    return f"target area: x={min_x}..{max_x}, y={min_y}..{max_y}\n"
+
+
+def generate_day18(rng: random.Random, scale: int) -> str:
+    def generate_element(depth: int) -> int | list:
+        if depth >= 4 or rng.random() < 0.35:
+            return rng.randint(0, 9)
+        return generate_pair(depth + 1)
+
+    def generate_pair(depth: int) -> list:
+        return [generate_element(depth), generate_element(depth)]
+
+    return (
+        "\n".join(str(generate_pair(1)).replace(" ", "") for _ in range(100 * scale))
+        + "\n"
+    )
+
+
+def generate_day19(rng: random.Random, scale: int) -> str:
+    rotations = [
+        (permutation, signs)
+        for permutation in itertools.permutations(range(3))
+        for signs in itertools.product([1, -1], repeat=3)
+        if signs[0] * signs[1] * signs[2] * permutation_parity(permutation) == 1
+    ]
+
+    def random_point(low: tuple[int, ...], high: tuple[int, ...]) -> tuple:
+        return tuple(rng.randint(lo, hi) for lo, hi in zip(low, high))
+
+    # Each new scanner overlaps an already placed scanner and shares at
+    # least 12 beacons with it so the map can always be assembled. Scanners
+    # are kept apart from each other so they do not all see the same beacons.
+    scanner_positions: list[tuple[int, ...]] = [(0, 0, 0)]
+    beacons: set[tuple[int, ...]] = set()
+    while len(scanner_positions) < 30 * scale + 1:
+        parent = rng.choice(scanner_positions)
+        position = tuple(p + rng.randint(-1300, 1300) for p in parent)
+        if any(
+            max(abs(p - q) for p, q in zip(position, other)) < 1000
+            for other in scanner_positions
+        ):
+            continue
+        overlap_low = tuple(max(p, q) - 1000 for p, q in zip(parent, position))
+        overlap_high = tuple(min(p, q) + 1000 for p, q in zip(parent, position))
+        for _ in range(13):
+            beacons.add(random_point(overlap_low, overlap_high))
+        for _ in range(6):
+            beacons.add(
+                random_point(
+                    tuple(p - 1000 for p in position), tuple(p + 1000 for p in position)
+                )
+            )
+        scanner_positions.append(position)
+
+    scanners = []
+    for index, position in enumerate(scanner_positions):
+        permutation, signs = rotations[0] if index == 0 else rng.choice(rotations)
+        lines = [f"--- scanner {index} ---"]
+        for beacon in beacons:
+            relative = [b - p for b, p in zip(beacon, position)]
+            if all(abs(r) <= 1000 for r in relative):
+                rotated = [signs[i] * relative[permutation[i]] for i in range(3)]
+                lines.append(",".join(str(r) for r in rotated))
+        scanners.append("\n".join(lines))
+    return "\n\n".join(scanners) + "\n"
+
+
+def permutation_parity(permutation: tuple[int, ...]) -> int:
+    inversions = sum(
+        1
+        for i in range(len(permutation))
+        for j in range(i + 1, len(permutation))
+        if permutation[i] > permutation[j]
+    )
+    return -1 if inversions % 2 else 1
+
+
+def generate_day20(rng: random.Random, scale: int) -> str:
+    # The solution relies on the algorithm flipping infinity between dark and
+    # light on every step.
+    algorithm = ["#"] + rng.choices("#.", k=510) + ["."]
+    side = scale_side(100, scale)
+    image = format_digit_grid(rng, side, side, digits="#.")
+    return "".join(algorithm) + "\n\n" + image
+
+
+def generate_day21(rng: random.Random, scale: int) -> str:
+    return (
+        f"Player 1 starting position: {rng.randint(1, 9)}\n"
+        f"Player 2 starting position: {rng.randint(1, 9)}\n"
+    )
+
+
+def generate_day22(rng: random.Random, scale: int) -> str:
+    def format_step(bound: int, min_size: int, max_size: int) -> str:
+        ranges = []
+        for axis in "xyz":
+            size = rng.randint(min_size, max_size)
+            start = rng.randint(-bound, bound - size)
+            ranges.append(f"{axis}={start}..{start + size}")
+        on_or_off = "on" if rng.random() < 0.7 else "off"
+        return f"{on_or_off} {','.join(ranges)}"
+
+    lines = [format_step(50, 10, 50) for _ in range(20)]
+    lines += [format_step(100000, 5000, 40000) for _ in range(400 * scale)]
+    return "\n".join(lines) + "\n"
+
+
+def generate_day23(rng: random.Random, scale: int) -> str:
+    amphipods = rng.sample("AABBCCDD", 8)
+    return (
+        "#############\n"
+        "#...........#\n"
+        f"###{'#'.join(amphipods[:4])}###\n"
+        f"  #{'#'.join(amphipods[4:])}#\n"
+        "  #########\n"
+    )
+
+
+def generate_day24(rng: random.Random, scale: int) -> str:
+    # The solution is derived by hand from this particular MONAD program so
+    # it is the only valid input.
+    with open(get_input_path(24)) as f:
+        return f.read()
+
+
+def generate_day25(rng: random.Random, scale: int) -> str:
+    m, n = scale_side(137, scale), scale_side(139, scale)
+    rows = ("".join(rng.choices(">v.", [1, 1, 2], k=n)) for _ in range(m))
+    return "\n".join(rows) + "\n"
+
+
+GENERATORS: dict[int, InputGenerator] = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+    13: generate_day13,
+    14: generate_day14,
+    15: generate_day15,
+    16: generate_day16,
+    17: generate_day17,
+    18: generate_day18,
+    19: generate_day19,
+    20: generate_day20,
+    21: generate_day21,
+    22: generate_day22,
+    23: generate_day23,
+    24: generate_day24,
+    25: generate_day25,
+}
+
+
+def write_input(directory: str, day: int, scale: int, seed: int = 0) -> str:
+    """Write a generated input for the day to the directory and return its path.
+
+    The generator is seeded from the seed, day and scale so the same input is
+    produced on every run."""
+    rng = random.Random(f"{seed}-{day}-{scale}")
+    path = os.path.join(directory, f"input{day}x{scale}.txt")
+    with open(path, "w") as f:
+        f.write(GENERATORS[day](rng, scale))
+    return path
@@ -0,0 +1,199 @@
+from array import array
+from collections.abc import Iterable
+from functools import lru_cache
+
+ORTHOGONAL_OFFSETS = ((-1, 0), (0, -1), (0, 1), (1, 0))
+ALL_OFFSETS = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+)
+
+# The number of grid shapes whose tables are kept, so long-lived processes
+# solving many inputs do not accumulate them
+TABLE_CACHE_SIZE = 8
+
+
+class NeighborTable:
+    """The indices of the neighbours of every cell of a grid, stored
+    compactly as one flat array of neighbour indices and the offset into it
+    at which each cell's neighbours start."""
+
+    def __init__(self, starts: array, indices: array) -> None:
+        self.starts = starts
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.starts) - 1
+
+    def __getitem__(self, index: int) -> array:
+        return self.indices[self.starts[index] : self.starts[index + 1]]
+
+
+class Grid:
+    """An m by n grid of small non-negative integers stored row-major in a
+    flat bytearray, so cell (i, j) lives at index i * n + j.
+
+    Neighbour tables map each index to the indices of its neighbours. They are
+    computed once per grid shape and shared between grids of that shape (for
+    the most recently used shapes), so hot loops can walk
+    `grid.neighbors4[index]` without computing positions. When `wrap` is
+    set the grid is a torus; otherwise reads outside of it return `fill`."""
+
+    def __init__(
+        self,
+        m: int,
+        n: int,
+        cells: bytearray | None = None,
+        fill: int = 0,
+        wrap: bool = False,
+    ) -> None:
+        if cells is None:
+            cells = bytearray([fill]) * (m * n)
+        elif len(cells) != m * n:
+            raise ValueError(f"Expected {m * n} cells but got {len(cells)}")
+        self.m = m
+        self.n = n
+        self.cells = cells
+        self.fill = fill
+        self.wrap = wrap
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Iterable[int]], fill: int = 0, wrap: bool = False
+    ) -> "Grid":
+        cells = bytearray()
+        m = 0
+        for row in rows:
+            cells.extend(row)
+            m += 1
+        return cls(m, len(cells) // m if m else 0, cells, fill, wrap)
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Iterable[str],
+        values: dict[str, int] | None = None,
+        fill: int = 0,
+        wrap: bool = False,
+    ) -> "Grid":
+        """Build a grid from lines of characters, either digits or characters
+        mapped to values."""
+        rows = (line.strip() for line in lines)
+        if values is None:
+            return cls.from_rows(
+                (
+                    (c - 48 for c in row.encode())  # ord("0") == 48
+                    for row in rows
+                    if row
+                ),
+                fill,
+                wrap,
+            )
+        return cls.from_rows(
+            ((values[c] for c in row) for row in rows if row), fill, wrap
+        )
+
+    def __len__(self) -> int:
+        return self.m * self.n
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Grid) and (self.m, self.n, self.cells) == (
+            other.m,
+            other.n,
+            other.cells,
+        )
+
+    def __getitem__(self, position: tuple[int, int]) -> int:
+        i, j = position
+        if self.wrap:
+            return self.cells[(i % self.m) * self.n + j % self.n]
+        if 0 <= i < self.m and 0 <= j < self.n:
+            return self.cells[i * self.n + j]
+        return self.fill
+
+    def __setitem__(self, position: tuple[int, int], value: int) -> None:
+        i, j = position
+        self.cells[self.index(i, j)] = value
+
+    def index(self, i: int, j: int) -> int:
+        if self.wrap:
+            return (i % self.m) * self.n + j % self.n
+        return i * self.n + j
+
+    def position(self, index: int) -> tuple[int, int]:
+        return divmod(index, self.n)
+
+    def copy(self) -> "Grid":
+        return Grid(self.m, self.n, self.cells[:], self.fill, self.wrap)
+
+    def rows(self) -> list[bytearray]:
+        return [self.cells[i * self.n : (i + 1) * self.n] for i in range(self.m)]
+
+    def transpose(self) -> "Grid":
+        cells = bytearray(len(self.cells))
+        for i in range(self.m):
+            cells[i :: self.m] = self.cells[i * self.n : (i + 1) * self.n]
+        return Grid(self.n, self.m, cells, self.fill, self.wrap)
+
+    def padded(self, border: int, fill: int | None = None) -> "Grid":
+        """Return a copy of the grid with `border` extra cells of `fill` (by
+        default the grid's own fill) on every side."""
+        fill = self.fill if fill is None else fill
+        n = self.n + 2 * border
+        padded = Grid(self.m + 2 * border, n, fill=fill)
+        for i in range(self.m):
+            start = (i + border) * n + border
+            padded.cells[start : start + self.n] = self.cells[
+                i * self.n : (i + 1) * self.n
+            ]
+        return padded
+
+    def offsets(self, di: int, dj: int) -> array:
+        """The index of the cell (di, dj) away from each cell, or -1 where that
+        is outside of a grid which does not wrap."""
+        return offset_table(self.m, self.n, di, dj, self.wrap)
+
+    @property
+    def neighbors4(self) -> NeighborTable:
+        return neighbor_table(self.m, self.n, ORTHOGONAL_OFFSETS, self.wrap)
+
+    @property
+    def neighbors8(self) -> NeighborTable:
+        return neighbor_table(self.m, self.n, ALL_OFFSETS, self.wrap)
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def offset_table(m: int, n: int, di: int, dj: int, wrap: bool) -> array:
+    table = array("i")
+    for i in range(m):
+        for j in range(n):
+            x, y = i + di, j + dj
+            if wrap:
+                table.append((x % m) * n + y % n)
+            elif 0 <= x < m and 0 <= y < n:
+                table.append(x * n + y)
+            else:
+                table.append(-1)
+    return table
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def neighbor_table(
+    m: int, n: int, offsets: tuple[tuple[int, int], ...], wrap: bool
+) -> NeighborTable:
+    tables = [offset_table(m, n, di, dj, wrap) for di, dj in offsets]
+    starts = array("i", [0])
+    indices = array("i")
+    for index in range(m * n):
+        for table in tables:
+            neighbor = table[index]
+            if neighbor >= 0 and neighbor != index:
+                indices.append(neighbor)
+        starts.append(len(indices))
+    return NeighborTable(starts, indices)
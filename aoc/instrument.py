@@ -0,0 +1,98 @@
+"""Opt-in profiling and hot-path counters for the solutions.
+
+Instrumentation is switched on with the AOC_INSTRUMENT environment variable
+or `enable()`. Solvers bump named counters and timers through `count` and
+`timer`, but in hot loops should check `ENABLED` once up front and only
+count when it is set so that nothing is paid when instrumentation is off:
+
+    counting = instrument.ENABLED
+    for ...:
+        if counting:
+            pops += 1
+    if counting:
+        instrument.count("heap_pops", pops)
+"""
+
+import os
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+
+ENVIRONMENT_VARIABLE = "AOC_INSTRUMENT"
+TOP_FUNCTIONS = 15
+
+ENABLED = os.environ.get(ENVIRONMENT_VARIABLE, "") not in ("", "0")
+
+counters: Counter[str] = Counter()
+timers: defaultdict[str, float] = defaultdict(float)
+
+
+def enable() -> None:
+    global ENABLED
+    ENABLED = True
+    # Worker processes started after this inherit the switch
+    os.environ[ENVIRONMENT_VARIABLE] = "1"
+
+
+def count(name: str, amount: int = 1) -> None:
+    if ENABLED:
+        counters[name] += amount
+
+
+def timer(name: str) -> AbstractContextManager[None]:
+    return _timer(name) if ENABLED else nullcontext()
+
+
+@contextmanager
+def _timer(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timers[name] += time.perf_counter() - start
+
+
+@contextmanager
+def profile(report: dict) -> Iterator[None]:
+    """Profile the block with cProfile and tracemalloc and fill the report
+    with the counters, timers, peak traced memory and hottest functions."""
+    # Only needed when profiling so kept off the import path of every solution
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    counters.clear()
+    timers.clear()
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report["counters"] = dict(counters)
+        report["timers"] = dict(timers)
+        report["peak_bytes"] = peak_bytes
+        stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+        report["functions"] = get_top_functions(stats)
+
+
+def get_top_functions(stats: dict) -> list[dict]:
+    rows = []
+    for (filename, line, name), (_, calls, total, cumulative, _) in sorted(
+        stats.items(),
+        key=lambda item: item[1][3],
+        reverse=True,
+    )[:TOP_FUNCTIONS]:
+        rows.append(
+            {
+                "function": f"{os.path.basename(filename)}:{line}({name})",
+                "calls": calls,
+                "total_seconds": total,
+                "cumulative_seconds": cumulative,
+            }
+        )
+    return rows
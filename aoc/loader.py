@@ -0,0 +1,138 @@
+"""Bulk parsers over memory-mapped inputs.
+
+Solutions map their whole input with `map_input` and hand the buffer to one of
+the parsers below, which split and convert it with a few C-level passes rather
+than building a str per line:
+
+    def parse_input(f) -> Grid:
+        with loader.map_input(f) as data:
+            return loader.parse_grid(data)
+"""
+
+import mmap
+import os
+from array import array
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from aoc.grid import Grid
+
+Buffer = bytes | mmap.mmap
+
+T = TypeVar("T")
+
+# Chunks are parsed whole, so this bounds each worker's memory
+MAX_CHUNK_BYTES = 32 * 1024 * 1024
+
+# ord("0") == 48 so the digit characters translate to their values
+DIGIT_TABLE = bytes(range(256)).translate(
+    bytes.maketrans(b"0123456789", bytes(range(10)))
+)
+
+
+@contextmanager
+def map_input(f) -> Iterator[Buffer]:
+    """Memory-map the whole of the file f is reading. Files without a file
+    descriptor (e.g. io.StringIO) or empty files are read into memory instead.
+    The map is closed on leaving the block, so parsers must copy out of it."""
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # io.UnsupportedOperation is an OSError and empty files are a ValueError
+        data = f.read()
+        yield data.encode() if isinstance(data, str) else data
+        return
+    with mapped:
+        yield mapped
+
+
+def find_line_boundaries(path: str, chunk_count: int) -> list[int]:
+    """Split the file into about chunk_count byte ranges, moving each boundary
+    forward to the start of a line."""
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, "rb") as f, map_input(f) as data:
+        for i in range(1, chunk_count):
+            newline = data.find(b"\n", max(i * size // chunk_count, boundaries[-1]))
+            if newline < 0:
+                break
+            boundaries.append(newline + 1)
+    if boundaries[-1] != size:
+        boundaries.append(size)
+    return boundaries
+
+
+def map_chunks(
+    function: Callable[..., T],
+    path: str,
+    *args: Any,
+    max_workers: int | None = None,
+) -> list[T]:
+    """Split the file into chunks of whole lines, at least one per worker and
+    at most MAX_CHUNK_BYTES each, and call function(path, start, end, *args)
+    on every chunk's byte range in a pool of processes. The results are
+    returned in file order, for the caller to stitch together."""
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_count = max(max_workers, -(-os.path.getsize(path) // MAX_CHUNK_BYTES))
+    boundaries = find_line_boundaries(path, chunk_count)
+    chunk_args = [
+        (path, start, end, *args) for start, end in zip(boundaries, boundaries[1:])
+    ]
+    if max_workers == 1:
+        return [function(*arguments) for arguments in chunk_args]
+
+    # Deferred as only this path needs a process pool
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        return list(executor.map(function, *zip(*chunk_args)))
+
+
+def make_table(values: dict[str, int]) -> bytes:
+    return bytes(range(256)).translate(
+        bytes.maketrans("".join(values).encode(), bytes(values[c] for c in values))
+    )
+
+
+def parse_grid(
+    data: Buffer,
+    values: dict[str, int] | None = None,
+    fill: int = 0,
+    wrap: bool = False,
+) -> Grid:
+    """Parse lines of equal width into a grid, either of digits or of
+    characters mapped to values, translating every cell in a single pass."""
+    width = data.find(b"\n")
+    if width < 0:
+        width = len(data)
+    elif width > 0 and data[width - 1] == ord("\r"):
+        width -= 1
+
+    table = DIGIT_TABLE if values is None else make_table(values)
+    cells = bytearray(data[:].translate(table, b"\r\n"))
+    if width == 0 or len(cells) % width:
+        raise ValueError(f"Expected lines of width {width}")
+    return Grid(len(cells) // width, width, cells, fill, wrap)
+
+
+def find_integers(data: Buffer) -> list[bytes]:
+    # Deferred as importing re is a large share of a solution's start up time.
+    # The compiled pattern is cached by re itself.
+    import re
+
+    return re.findall(rb"-?\d+", data)
+
+
+def parse_int_array(data: Buffer, typecode: str = "q") -> array:
+    """Parse comma (or whitespace) separated integers into an array."""
+    return array(typecode, map(int, data[:].replace(b",", b" ").split()))
+
+
+def parse_records(data: Buffer, fields: int) -> list[tuple[int, ...]]:
+    """Parse every integer in data, ignoring the text around them, and group
+    them into consecutive records of `fields` integers each."""
+    values = array("q", map(int, find_integers(data)))
+    if len(values) % fields:
+        raise ValueError(f"Expected a multiple of {fields} integers")
+    return list(zip(*[iter(values)] * fields))
@@ -0,0 +1,248 @@
+import argparse
+import importlib
+import json
+import os
+import re
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc import instrument
+from aoc.cache import MISSING, ResultCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAY_DIRECTORY_REGEX_PATTERN = re.compile(r"day(?P<day>\d+)")
+PART_NAMES = {1: "Part One", 2: "Part Two"}
+
+Answer = int | str
+
+
+@dataclass(frozen=True)
+class PartResult:
+    day: int
+    part: int
+    answer: Answer
+    parse_seconds: float
+    solve_seconds: float
+    # Parts which share state are solved together so the solve time is for both
+    shared: bool = False
+    profile: dict | None = None
+    cached: bool = False
+
+
+def discover_days() -> list[int]:
+    days = []
+    for name in os.listdir(ROOT):
+        m = DAY_DIRECTORY_REGEX_PATTERN.fullmatch(name)
+        if m is None:
+            continue
+        day = int(m.group("day"))
+        if os.path.isfile(get_solution_path(day)):
+            days.append(day)
+    return sorted(days)
+
+
+def get_solution_path(day: int) -> str:
+    return os.path.join(ROOT, f"day{day}", f"solution{day}.py")
+
+
+def get_input_path(day: int) -> str:
+    return os.path.join(ROOT, f"day{day}", f"input{day}.txt")
+
+
+def load_solution(day: int) -> ModuleType:
+    return importlib.import_module(f"day{day}.solution{day}")
+
+
+def get_tasks(day: int) -> list[tuple[int, ...]]:
+    """Split a day into the groups of parts which can be run independently.
+
+    Solutions whose parts share an expensive intermediate result expose a
+    `solve` function answering both parts at once."""
+    if hasattr(load_solution(day), "solve"):
+        return [(1, 2)]
+    return [(1,), (2,)]
+
+
+def run_parts(
+    day: int,
+    parts: tuple[int, ...],
+    input_path: str | None = None,
+    cache: ResultCache | None = None,
+) -> list[PartResult]:
+    solution = load_solution(day)
+    input_path = input_path or get_input_path(day)
+    key = cache.make_key(input_path, get_solution_path(day)) if cache else ""
+
+    start = time.perf_counter()
+    parsed = cache.get(key, "parse") if cache else MISSING
+    if parsed is MISSING:
+        with open(input_path) as f:
+            parsed = solution.parse_input(f)
+        if cache:
+            cache.set(key, "parse", parsed)
+    parse_seconds = time.perf_counter() - start
+
+    if parts == (1, 2):
+        answers, solve_seconds, profile = run_instrumented(solution.solve, parsed)
+        results = [
+            PartResult(day, part, answer, parse_seconds, solve_seconds, True, profile)
+            for part, answer in zip(parts, answers)
+        ]
+    else:
+        results = []
+        for part in parts:
+            solve_part = solution.part_one if part == 1 else solution.part_two
+            answer, solve_seconds, profile = run_instrumented(solve_part, parsed)
+            results.append(
+                PartResult(
+                    day, part, answer, parse_seconds, solve_seconds, False, profile
+                )
+            )
+
+    if cache:
+        for result in results:
+            cache.set(key, f"part{result.part}", result.answer)
+    return results
+
+
+def get_cached_results(
+    day: int, cache: ResultCache, input_path: str | None = None
+) -> list[PartResult] | None:
+    """Return both parts' answers if they are cached for the current input and
+    solution source, without importing the solution."""
+    key = cache.make_key(input_path or get_input_path(day), get_solution_path(day))
+    results = []
+    for part in PART_NAMES:
+        answer = cache.get(key, f"part{part}")
+        if answer is MISSING:
+            return None
+        results.append(PartResult(day, part, answer, 0, 0, cached=True))
+    return results
+
+
+def run_instrumented(
+    solve: Callable[[Any], Any], parsed: Any
+) -> tuple[Any, float, dict | None]:
+    if not instrument.ENABLED:
+        start = time.perf_counter()
+        answer = solve(parsed)
+        return answer, time.perf_counter() - start, None
+
+    profile: dict = {}
+    with instrument.profile(profile):
+        start = time.perf_counter()
+        answer = solve(parsed)
+        solve_seconds = time.perf_counter() - start
+    return answer, solve_seconds, profile
+
+
+def run_days(
+    days: list[int],
+    max_workers: int | None = None,
+    cache: ResultCache | None = None,
+) -> list[PartResult]:
+    results: list[PartResult] = []
+    uncached_days = []
+    for day in days:
+        cached_results = get_cached_results(day, cache) if cache else None
+        if cached_results is None:
+            uncached_days.append(day)
+        else:
+            results.extend(cached_results)
+
+    if uncached_days:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures: list[Future[list[PartResult]]] = [
+                executor.submit(run_parts, day, parts, None, cache)
+                for day in uncached_days
+                for parts in get_tasks(day)
+            ]
+            results.extend(result for future in futures for result in future.result())
+    if cache:
+        cache.evict()
+
+    return sorted(results, key=lambda result: (result.day, result.part))
+
+
+def format_result(result: PartResult) -> str:
+    timing = f"parse {result.parse_seconds:.3f}s, solve {result.solve_seconds:.3f}s"
+    if result.cached:
+        timing = "cached"
+    elif result.shared:
+        timing += ", shared"
+    answer = str(result.answer)
+    separator = "\n" if "\n" in answer else " "
+    line = f"  {PART_NAMES[result.part]} ({timing}):{separator}{answer}"
+    if result.profile is not None:
+        peak_mib = result.profile["peak_bytes"] / 1024 / 1024
+        line += f"\n    peak {peak_mib:.1f} MiB"
+        for name, value in sorted(result.profile["counters"].items()):
+            line += f"\n    {name}: {value}"
+        for name, seconds in sorted(result.profile["timers"].items()):
+            line += f"\n    {name}: {seconds:.3f}s"
+    return line
+
+
+def write_report(path: str, results: list[PartResult]) -> None:
+    with open(path, "w") as f:
+        json.dump([asdict(result) for result in results], f, indent=2)
+        f.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run the solutions for each day in parallel."
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=int,
+        help="days to run (defaults to every discovered day)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes (defaults to the number of cores)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile each part and collect the solutions' counters and timers "
+        f"(also enabled by setting {instrument.ENVIRONMENT_VARIABLE}=1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always parse and solve rather than reusing cached results "
+        "(the cache is also bypassed when profiling)",
+    )
+    parser.add_argument(
+        "--report",
+        help="write a JSON report of the results (including profiles) to this path",
+    )
+    args = parser.parse_args()
+
+    if args.profile:
+        instrument.enable()
+
+    days = args.days or discover_days()
+    start = time.perf_counter()
+    cache = None if args.no_cache or instrument.ENABLED else ResultCache()
+    results = run_days(days, args.workers, cache)
+    total_seconds = time.perf_counter() - start
+
+    current_day = None
+    for result in results:
+        if result.day != current_day:
+            current_day = result.day
+            print(f"Day {result.day}:")
+        print(format_result(result))
+    print(f"Total: {total_seconds:.3f}s wall-clock")
+
+    if args.report:
+        write_report(args.report, results)
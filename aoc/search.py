@@ -0,0 +1,177 @@
+import heapq
+import math
+from collections import defaultdict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, NamedTuple, TypeVar
+
+from aoc import instrument
+
+Node = TypeVar("Node", bound=Hashable)
+GetNeighbors = Callable[[Node], Iterable[tuple[Node, int]]]
+
+
+class SearchResult(NamedTuple):
+    # None when the target cannot be reached
+    distance: int | None
+    path: list
+    nodes_expanded: int
+    pushes: int
+    pops: int
+
+
+def dijkstra(
+    start: Node,
+    target: Node,
+    get_neighbors: GetNeighbors[Node],
+    heuristic: Callable[[Node], int] | None = None,
+    size: int | None = None,
+) -> SearchResult:
+    """Find the shortest path from start to target, stopping as soon as the
+    target is expanded. Passing a consistent heuristic (one which never
+    overestimates the remaining distance) turns the search into A*.
+
+    Rather than decrease-key, improved nodes are pushed again and stale entries
+    are skipped when popped, which is cheaper with heapq. Edge weights must be
+    non-negative."""
+    distances, previous = make_tables(start, size)
+    # The push count breaks ties so nodes themselves are never compared
+    queue: list[tuple[int, int, int, Node]] = [
+        (heuristic(start) if heuristic else 0, 0, 0, start)
+    ]
+    found = False
+    nodes_expanded = 0
+    pushes = 1
+    pops = 0
+
+    while queue:
+        _, _, distance, node = heapq.heappop(queue)
+        pops += 1
+        if distance > distances[node]:
+            # Superseded by a shorter path found after this entry was pushed
+            continue
+        nodes_expanded += 1
+        if node == target:
+            found = True
+            break
+
+        for neighbor, weight in get_neighbors(node):
+            candidate_distance = distance + weight
+            if candidate_distance < distances[neighbor]:
+                distances[neighbor] = candidate_distance
+                previous[neighbor] = node
+                priority = candidate_distance
+                if heuristic is not None:
+                    priority += heuristic(neighbor)
+                heapq.heappush(queue, (priority, pushes, candidate_distance, neighbor))
+                pushes += 1
+
+    instrument.count("heap_pushes", pushes)
+    instrument.count("heap_pops", pops)
+    return make_result(
+        start,
+        target if found else None,
+        previous,
+        distance,
+        nodes_expanded,
+        pushes,
+        pops,
+    )
+
+
+def dial(
+    start: Node,
+    target: Node,
+    get_neighbors: GetNeighbors[Node],
+    max_weight: int,
+    size: int | None = None,
+) -> SearchResult:
+    """Dijkstra's algorithm with a bucket queue, for graphs whose edge weights
+    are small non-negative integers no greater than max_weight.
+
+    Every queued node is within max_weight of the current distance, so a ring
+    of max_weight + 1 buckets indexed by distance replaces the heap and each
+    push and pop is O(1)."""
+    bucket_count = max_weight + 1
+    buckets: list[list[Node]] = [[] for _ in range(bucket_count)]
+    buckets[0].append(start)
+    distances, previous = make_tables(start, size)
+    found = False
+    nodes_expanded = 0
+    queued = 1
+    pushes = 1
+    pops = 0
+
+    distance = 0
+    while queued:
+        bucket = buckets[distance % bucket_count]
+        while bucket:
+            node = bucket.pop()
+            queued -= 1
+            pops += 1
+            if distance > distances[node]:
+                # Superseded by a shorter path found after this entry was pushed
+                continue
+            nodes_expanded += 1
+            if node == target:
+                found = True
+                break
+
+            for neighbor, weight in get_neighbors(node):
+                candidate_distance = distance + weight
+                if candidate_distance < distances[neighbor]:
+                    distances[neighbor] = candidate_distance
+                    previous[neighbor] = node
+                    buckets[candidate_distance % bucket_count].append(neighbor)
+                    queued += 1
+                    pushes += 1
+        if found:
+            break
+        distance += 1
+
+    instrument.count("bucket_pushes", pushes)
+    instrument.count("bucket_pops", pops)
+    return make_result(
+        start,
+        target if found else None,
+        previous,
+        distance,
+        nodes_expanded,
+        pushes,
+        pops,
+    )
+
+
+def make_tables(start: Node, size: int | None) -> tuple[Any, Any]:
+    """Make the tables of best distances and previous nodes. When the nodes
+    are the integers below size, lists are much faster than dictionaries."""
+    distances: Any
+    previous: Any
+    if size is None:
+        distances = defaultdict(lambda: math.inf)
+        previous = {}
+    else:
+        distances = [math.inf] * size
+        previous = [None] * size
+    distances[start] = 0
+    return distances, previous
+
+
+def make_result(
+    start: Node,
+    target: Node | None,
+    previous: Any,
+    distance: int,
+    nodes_expanded: int,
+    pushes: int,
+    pops: int,
+) -> SearchResult:
+    instrument.count("nodes_expanded", nodes_expanded)
+    if target is None:
+        return SearchResult(None, [], nodes_expanded, pushes, pops)
+
+    path = [target]
+    node = target
+    while node != start:
+        node = previous[node]
+        path.append(node)
+    return SearchResult(distance, path[::-1], nodes_expanded, pushes, pops)
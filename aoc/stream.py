@@ -0,0 +1,48 @@
+import argparse
+import os
+import sys
+
+from aoc.runner import PART_NAMES, load_solution
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Solve both parts of a day in a single pass, reading its "
+        "input lazily line by line so memory does not grow with the input."
+    )
+    parser.add_argument("day", type=int, help="day to solve")
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default="-",
+        help="input file to stream (defaults to stdin)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes for days which scan chunks of a file "
+        "in parallel (defaults to the number of cores)",
+    )
+    args = parser.parse_args()
+
+    solution = load_solution(args.day)
+    if not hasattr(solution, "solve_stream"):
+        parser.error(f"day {args.day} does not support streaming")
+
+    if args.path == "-":
+        answers = solution.solve_stream(sys.stdin)
+    elif hasattr(solution, "solve_file"):
+        answers = solution.solve_file(args.path, args.workers)
+    else:
+        with open(args.path) as f:
+            answers = solution.solve_stream(f)
+
+    for name, answer in zip(PART_NAMES.values(), answers):
+        print(f"{name}:")
+        print(answer)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,126 @@
 #!/usr/bin/env python3
 import os
+from collections import deque
+from collections.abc import Sequence
+from itertools import islice
+from operator import lt
 
+from aoc import loader
 
-def count_increases(xs: list[int]) -> int:
-    count = 0
-    current = xs[0]
 
-    for i in range(1, len(xs)):
-        next = xs[i]
-        if next - current > 0:
-            count += 1
-        current = next
+def count_increasing_windows(xs: Sequence[int], k: int = 1) -> int:
+    """Count the windows of k consecutive measurements whose sum is larger
+    than that of the window before.
 
-    return count
+    Consecutive windows share all but their first and last measurements, so
+    this is just the number of i with xs[i + k] > xs[i] and no window sums are
+    built. The pairs are compared in a single C-level map over xs and xs
+    offset by k."""
+    if k < 1:
+        raise ValueError("Expected a window size of at least 1")
+    return sum(map(lt, xs, islice(xs, k, None)))
 
 
-def count_sliding_window_increases(xs: list[int]) -> int:
-    count = 0
-    first, second, third = xs[0], xs[1], xs[2]
+def solve_stream(f) -> tuple[int, int]:
+    """Answer both parts in one pass over the measurements, holding only the
+    last three in memory.
 
-    for i in range(3, len(xs)):
-        fourth = xs[i]
-        start = first + second + third
-        end = start - first + fourth
-        if end - start > 0:
-            count += 1
-        first, second, third = second, third, fourth
+    Consecutive windows share two measurements, so the window sum increases
+    exactly when the new measurement is larger than the one leaving."""
+    increases = 0
+    window_increases = 0
+    window: deque[int] = deque(maxlen=3)
 
-    return count
+    for line in f:
+        # Blank lines are skipped, as parse_int_array does
+        if not line.strip():
+            continue
+        measurement = int(line)
+        if window and measurement > window[-1]:
+            increases += 1
+        if len(window) == 3 and measurement > window[0]:
+            window_increases += 1
+        window.append(measurement)
+
+    return increases, window_increases
+
+
+def count_chunk_increasing_windows(
+    path: str, start: int, end: int, window_sizes: Sequence[int]
+) -> tuple[list[int], list[int], list[int]]:
+    """Count the increasing windows lying wholly within a byte range of the
+    file, and return its first and last (largest window size) measurements so
+    windows crossing into the neighbouring chunks can be stitched."""
+    with open(path, "rb") as f, loader.map_input(f) as data:
+        measurements = loader.parse_int_array(data[start:end])
+    k = max(window_sizes)
+    return (
+        [
+            count_increasing_windows(measurements, window_size)
+            for window_size in window_sizes
+        ],
+        list(measurements[:k]),
+        list(measurements[-k:]),
+    )
+
+
+def count_file_increasing_windows(
+    path: str, window_sizes: Sequence[int], max_workers: int | None = None
+) -> list[int]:
+    """Count the increasing windows of each size in a file of measurements
+    too large to hold in memory, scanning chunks of it in parallel.
+
+    A window of size k is increasing when xs[i + k] > xs[i], so only pairs of
+    measurements k apart cross a chunk boundary. Carrying the last k
+    measurements seen into the next chunk's first k counts each of those pairs
+    exactly once, matching a sequential scan."""
+    chunks = loader.map_chunks(
+        count_chunk_increasing_windows, path, window_sizes, max_workers=max_workers
+    )
+
+    counts = [0] * len(window_sizes)
+    k = max(window_sizes)
+    tail: list[int] = []
+    for chunk_counts, head, chunk_tail in chunks:
+        boundary = tail + head
+        for i, window_size in enumerate(window_sizes):
+            counts[i] += chunk_counts[i] + sum(
+                boundary[j] > boundary[j - window_size]
+                for j in range(max(len(tail), window_size), len(boundary))
+                if j - window_size < len(tail)
+            )
+        tail = (tail + chunk_tail)[-k:]
+    return counts
+
+
+def solve_file(path: str, max_workers: int | None = None) -> tuple[int, int]:
+    """Answer both parts for a file of measurements of any size in a single
+    parallel scan."""
+    increases, window_increases = count_file_increasing_windows(
+        path, (1, 3), max_workers
+    )
+    return increases, window_increases
+
+
+def parse_input(f) -> Sequence[int]:
+    with loader.map_input(f) as data:
+        return loader.parse_int_array(data)
+
+
+def part_one(measurements: Sequence[int]) -> int:
+    return count_increasing_windows(measurements, 1)
+
+
+def part_two(measurements: Sequence[int]) -> int:
+    return count_increasing_windows(measurements, 3)
 
 
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input1.txt")) as f:
-        measurements = [int(line) for line in f]
+        measurements = parse_input(f)
 
     print("Part One:")
-    print(count_increases(measurements))
+    print(part_one(measurements))
 
     print("Part Two:")
-    print(count_sliding_window_increases(measurements))
+    print(part_two(measurements))
@@ -65,23 +65,57 @@ def score_completion_string(completion_string: str) -> int:
     return score
 
 
-if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input10.txt")) as f:
-        lines = [line.strip() for line in f]
+def parse_input(f) -> list[str]:
+    return [line.strip() for line in f]
 
-    print("Part One:")
-    print(
-        sum(
-            ILLEGAL_CHARACTER_SCORES[c]
-            for c in (find_first_illegal_character(line) for line in lines)
-            if c is not None
-        )
+
+def part_one(lines: list[str]) -> int:
+    return sum(
+        ILLEGAL_CHARACTER_SCORES[c]
+        for c in (find_first_illegal_character(line) for line in lines)
+        if c is not None
     )
 
+
+def part_two(lines: list[str]) -> int:
     completion_string_scores = [
         score_completion_string(completion_string)
         for completion_string in (find_completion_string(line) for line in lines)
         if completion_string is not None
     ]
+    return sorted(completion_string_scores)[len(completion_string_scores) // 2]
+
+
+def solve_stream(f) -> tuple[int, int]:
+    """Answer both parts in one pass over the navigation subsystem. Only the
+    completion score of each incomplete line is kept, for the median."""
+    syntax_error_score = 0
+    completion_string_scores = []
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        c = find_first_illegal_character(line)
+        if c is not None:
+            syntax_error_score += ILLEGAL_CHARACTER_SCORES[c]
+            continue
+        completion_string = find_completion_string(line)
+        if completion_string is not None:
+            completion_string_scores.append(score_completion_string(completion_string))
+
+    completion_string_scores.sort()
+    return (
+        syntax_error_score,
+        completion_string_scores[len(completion_string_scores) // 2],
+    )
+
+
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input10.txt")) as f:
+        lines = parse_input(f)
+
+    print("Part One:")
+    print(part_one(lines))
+
     print("Part Two:")
-    print(sorted(completion_string_scores)[len(completion_string_scores) // 2])
+    print(part_two(lines))
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 import os
-from typing import Generator
 
+from aoc import loader
+from aoc.grid import Grid
 
-def count_flashes(energy_levels: list[list[int]], steps: int) -> int:
-    to_step = [[energy_levels[i][j] for j in range(10)] for i in range(10)]
+
+def count_flashes(energy_levels: Grid, steps: int) -> int:
+    to_step = energy_levels.copy()
     total_flashes = 0
     for _ in range(steps):
         flashed = step(to_step)
@@ -12,8 +14,8 @@ def count_flashes(energy_levels: list[list[int]], steps: int) -> int:
     return total_flashes
 
 
-def count_steps_until_synchronized(energy_levels: list[list[int]]) -> int:
-    to_step = [[energy_levels[i][j] for j in range(10)] for i in range(10)]
+def count_steps_until_synchronized(energy_levels: Grid) -> int:
+    to_step = energy_levels.copy()
     steps = 0
     while not is_synchronized(to_step):
         step(to_step)
@@ -21,52 +23,58 @@ def count_steps_until_synchronized(energy_levels: list[list[int]]) -> int:
     return steps
 
 
-def is_synchronized(energy_levels: list[list[int]]) -> bool:
-    return all(energy_levels[i][j] == 0 for i in range(10) for j in range(10))
+def is_synchronized(energy_levels: Grid) -> bool:
+    return not any(energy_levels.cells)
 
 
-def step(energy_levels: list[list[int]]) -> set[tuple[int, int]]:
-    """Simulate a step and return the positions of the octopuses which flashed
+def step(energy_levels: Grid) -> list[int]:
+    """Simulate a step and return the indices of the octopuses which flashed
     during this step."""
-    for i in range(10):
-        for j in range(10):
-            energy_levels[i][j] += 1
+    levels = energy_levels.cells
+    neighbors = energy_levels.neighbors8
+
+    # An octopus flashes exactly when its energy level reaches 10 so it is
+    # only ever added to the flashes once.
+    to_flash = []
+    for index in range(len(levels)):
+        levels[index] += 1
+        if levels[index] == 10:
+            to_flash.append(index)
+
+    flashed = []
+    while to_flash:
+        index = to_flash.pop()
+        flashed.append(index)
+        for neighbor in neighbors[index]:
+            levels[neighbor] += 1
+            if levels[neighbor] == 10:
+                to_flash.append(neighbor)
+
+    for index in flashed:
+        levels[index] = 0
 
-    flashed = set()
-    while True:
-        new_flashes = set()
-        for i in range(10):
-            for j in range(10):
-                if energy_levels[i][j] > 9 and (i, j) not in flashed:
-                    flashed.add((i, j))
-                    new_flashes.add((i, j))
+    return flashed
 
-        for i, j in new_flashes:
-            for x, y in get_neighbors(i, j):
-                energy_levels[x][y] += 1
 
-        if not new_flashes:
-            break
+def parse_input(f) -> Grid:
+    with loader.map_input(f) as data:
+        return loader.parse_grid(data)
 
-    for i, j in flashed:
-        energy_levels[i][j] = 0
 
-    return flashed
+def part_one(energy_levels: Grid) -> int:
+    return count_flashes(energy_levels, 100)
 
 
-def get_neighbors(i: int, j: int) -> Generator[tuple[int, int], None, None]:
-    offsets = [(0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1)]
-    for dx, dy in offsets:
-        if 0 <= i + dx < 10 and 0 <= j + dy < 10:
-            yield i + dx, j + dy
+def part_two(energy_levels: Grid) -> int:
+    return count_steps_until_synchronized(energy_levels)
 
 
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input11.txt")) as f:
-        energy_levels = [[int(c) for c in line.strip()] for line in f]
+        energy_levels = parse_input(f)
 
     print("Part One:")
-    print(count_flashes(energy_levels, 100))
+    print(part_one(energy_levels))
 
     print("Part Two:")
-    print(count_steps_until_synchronized(energy_levels))
+    print(part_two(energy_levels))
@@ -70,12 +70,20 @@ def is_big_cave(node: str) -> bool:
     return node.isupper()
 
 
+def part_one(adjacency_list: dict[str, set[str]]) -> int:
+    return len(find_all_paths(adjacency_list))
+
+
+def part_two(adjacency_list: dict[str, set[str]]) -> int:
+    return len(find_all_paths_one_small_cave_at_most_twice(adjacency_list))
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input12.txt")) as f:
         adjacency_list = parse_input(f)
 
     print("Part One:")
-    print(len(find_all_paths(adjacency_list)))
+    print(part_one(adjacency_list))
 
     print("Part Two:")
-    print(len(find_all_paths_one_small_cave_at_most_twice(adjacency_list)))
+    print(part_two(adjacency_list))
@@ -2,8 +2,12 @@
 import os
 from typing import Literal
 
+from aoc.grid import Grid
 
-def parse_input(f) -> tuple[list[list[int]], list[tuple[Literal["x", "y"], int]]]:
+FoldInstruction = tuple[Literal["x", "y"], int]
+
+
+def parse_input(f) -> tuple[Grid, list[FoldInstruction]]:
     dots = set()
     for line in f:
         if not line.strip():
@@ -14,11 +18,11 @@ def parse_input(f) -> tuple[list[list[int]], list[tuple[Literal["x", "y"], int]]
     m = max([dot[0] for dot in dots]) + 1
     n = max([dot[1] for dot in dots]) + 1
 
-    dots_matrix: list[list[int]] = [[0] * n for _ in range(m)]
+    dots_matrix = Grid(m, n)
     for x, y in dots:
-        dots_matrix[x][y] = 1
+        dots_matrix.cells[x * n + y] = 1
 
-    fold_instructions: list[tuple[Literal["x", "y"], int]] = []
+    fold_instructions: list[FoldInstruction] = []
     for line in f:
         fold_line_split = line.strip().split("=")
         fold_direction, fold_position = fold_line_split[0], int(fold_line_split[1])
@@ -30,72 +34,62 @@ def parse_input(f) -> tuple[list[list[int]], list[tuple[Literal["x", "y"], int]]
     return dots_matrix, fold_instructions
 
 
-def count_visible_dots(dots_matrix: list[list[int]]) -> int:
-    m = len(dots_matrix)
-    n = len(dots_matrix[0])
-    return sum(dots_matrix[i][j] for i in range(m) for j in range(n))
+def count_visible_dots(dots_matrix: Grid) -> int:
+    return sum(dots_matrix.cells)
 
 
-def fold(
-    dots_matrix: list[list[int]], fold_instruction: tuple[Literal["x", "y"], int]
-) -> list[list[int]]:
-    original_m = len(dots_matrix)
-    original_n = len(dots_matrix[0])
+def fold(dots_matrix: Grid, fold_instruction: FoldInstruction) -> Grid:
+    original_m, original_n = dots_matrix.m, dots_matrix.n
+    cells = dots_matrix.cells
     fold_direction, fold_position = fold_instruction
 
-    m, n = (
-        (fold_position, original_n)
-        if fold_direction == "x"
-        else (original_m, fold_position)
-    )
-
-    folded = [[0] * n for _ in range(m)]
-    for i in range(m):
-        for j in range(n):
-            if (
-                dots_matrix[i][j]
-                or (
-                    fold_direction == "x"
-                    and 2 * fold_position - i < original_m
-                    and dots_matrix[2 * fold_position - i][j]
-                )
-                or (
-                    fold_direction == "y"
-                    and 2 * fold_position - j < original_n
-                    and dots_matrix[i][2 * fold_position - j]
-                )
-            ):
-                folded[i][j] = 1
+    if fold_direction == "x":
+        folded = Grid(fold_position, original_n)
+        for i in range(fold_position):
+            row = cells[i * original_n : (i + 1) * original_n]
+            mirrored_i = 2 * fold_position - i
+            if mirrored_i < original_m:
+                mirrored_row = cells[
+                    mirrored_i * original_n : (mirrored_i + 1) * original_n
+                ]
+                row = bytearray(a | b for a, b in zip(row, mirrored_row))
+            folded.cells[i * original_n : (i + 1) * original_n] = row
+    else:
+        folded = Grid(original_m, fold_position)
+        for i in range(original_m):
+            row = cells[i * original_n : i * original_n + fold_position]
+            for j in range(max(0, 2 * fold_position - original_n + 1), fold_position):
+                row[j] |= cells[i * original_n + 2 * fold_position - j]
+            folded.cells[i * fold_position : (i + 1) * fold_position] = row
 
     return folded
 
 
-def transpose(matrix: list[list[int]]) -> list[list[int]]:
-    m = len(matrix)
-    n = len(matrix[0])
-    transposed = [[0] * m for _ in range(n)]
-    for i in range(n):
-        for j in range(m):
-            transposed[i][j] = matrix[j][i]
-    return transposed
+def format_result(matrix: Grid) -> str:
+    return "\n".join(
+        "".join("X" if dot else " " for dot in row) for row in matrix.rows()
+    )
+
+
+def part_one(paper: tuple[Grid, list[FoldInstruction]]) -> int:
+    dots_matrix, fold_instructions = paper
+    return count_visible_dots(fold(dots_matrix, fold_instructions[0]))
 
 
-def pretty_print_result(matrix: list[list[int]]) -> None:
-    for row in matrix:
-        print("".join("X" if dot else " " for dot in row))
+def part_two(paper: tuple[Grid, list[FoldInstruction]]) -> str:
+    dots_matrix, fold_instructions = paper
+    folded = dots_matrix
+    for fold_instruction in fold_instructions:
+        folded = fold(folded, fold_instruction)
+    return format_result(folded.transpose())
 
 
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input13.txt")) as f:
-        dots_matrix, fold_instructions = parse_input(f)
+        paper = parse_input(f)
 
-    folded_once = fold(dots_matrix, fold_instructions[0])
     print("Part One:")
-    print(count_visible_dots(folded_once))
-
-    folded = dots_matrix
-    for fold_instruction in fold_instructions:
-        folded = fold(folded, fold_instruction)
+    print(part_one(paper))
 
     print("Part Two:")
-    pretty_print_result(transpose(folded))
+    print(part_two(paper))
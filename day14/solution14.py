@@ -52,20 +52,30 @@ def calculate_next_step_pair_counts(
     return next_pair_counts
 
 
-if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input14.txt")) as f:
-        polymer_template, pair_insertion_rules = parse_input(f)
-
+def count_most_and_least_common_difference(
+    polymer_template: str, pair_insertion_rules: dict[str, str], steps: int
+) -> int:
     polymer_letter_counts = count_letters_in_polymer(
-        polymer_template, pair_insertion_rules, 10
+        polymer_template, pair_insertion_rules, steps
     )
     letters_by_count = Counter(polymer_letter_counts).most_common()
+    return letters_by_count[0][1] - letters_by_count[-1][1]
+
+
+def part_one(polymer: tuple[str, dict[str, str]]) -> int:
+    return count_most_and_least_common_difference(*polymer, 10)
+
+
+def part_two(polymer: tuple[str, dict[str, str]]) -> int:
+    return count_most_and_least_common_difference(*polymer, 40)
+
+
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input14.txt")) as f:
+        polymer = parse_input(f)
+
     print("Part One:")
-    print(letters_by_count[0][1] - letters_by_count[-1][1])
+    print(part_one(polymer))
 
-    polymer_letter_counts = count_letters_in_polymer(
-        polymer_template, pair_insertion_rules, 40
-    )
-    letters_by_count = Counter(polymer_letter_counts).most_common()
     print("Part Two:")
-    print(letters_by_count[0][1] - letters_by_count[-1][1])
+    print(part_two(polymer))
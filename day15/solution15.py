@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
-import heapq
-import math
 import os
-from typing import Generator
 
+from aoc import loader, search
+from aoc.grid import Grid
 
-def generate_full_risk_levels(risk_levels_tile: list[list[int]]) -> list[list[int]]:
-    m = len(risk_levels_tile)
-    n = len(risk_levels_tile[0])
-    risk_levels = [[0] * 5 * n for _ in range(5 * m)]
+
+def generate_full_risk_levels(risk_levels_tile: Grid) -> Grid:
+    m = risk_levels_tile.m
+    n = risk_levels_tile.n
+    risk_levels = Grid(5 * m, 5 * n)
     for tile_x in range(5):
         for tile_y in range(5):
             for i in range(m):
@@ -16,60 +16,51 @@ def generate_full_risk_levels(risk_levels_tile: list[list[int]]) -> list[list[in
                     adjusted_i = (m * tile_x) + i
                     adjusted_j = (n * tile_y) + j
                     adjusted_risk_level = (
-                        (risk_levels_tile[i][j] + tile_x + tile_y - 1) % 9
+                        (risk_levels_tile.cells[i * n + j] + tile_x + tile_y - 1) % 9
                     ) + 1
-                    risk_levels[adjusted_i][adjusted_j] = adjusted_risk_level
+                    risk_levels.cells[adjusted_i * 5 * n + adjusted_j] = (
+                        adjusted_risk_level
+                    )
     return risk_levels
 
 
-def find_lowest_total_risk_path(risk_levels: list[list[int]]) -> list[tuple[int, int]]:
-    m = len(risk_levels)
-    n = len(risk_levels[0])
-    visited = [[False] * n for _ in range(m)]
-    distances = [[math.inf] * n for _ in range(m)]
-    previous: list[list[tuple[int, int] | None]] = [[None] * n for _ in range(m)]
-    priority_queue: list[tuple[int, tuple[int, int]]] = []
-
-    distances[0][0] = 0
-    heapq.heappush(priority_queue, (0, (0, 0)))
-
-    while priority_queue:
-        current_distance, (i, j) = heapq.heappop(priority_queue)
-        visited[i][j] = True
-        for x, y in get_neighbors(i, j, m, n):
-            if not visited[x][y]:
-                candidate_distance = current_distance + risk_levels[x][y]
-                if candidate_distance < distances[x][y]:
-                    distances[x][y] = candidate_distance
-                    previous[x][y] = (i, j)
-                    heapq.heappush(priority_queue, (candidate_distance, (x, y)))
-
-    lowest_total_risk_path = [(m - 1, n - 1)]
-    i, j = m - 1, n - 1
-    while (previous_value := previous[i][j]) is not None:
-        lowest_total_risk_path.append(previous_value)
-        i, j = previous_value
-    return lowest_total_risk_path[::-1]
-
-
-def get_neighbors(
-    i: int, j: int, m: int, n: int
-) -> Generator[tuple[int, int], None, None]:
-    offsets = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-    for dx, dy in offsets:
-        if 0 <= i + dx < m and 0 <= j + dy < n:
-            yield i + dx, j + dy
+def find_lowest_total_risk_path(risk_levels: Grid) -> list[int]:
+    """Find the lowest total risk path from the top left to the bottom right.
 
+    Returns the path as a list of grid indices."""
+    cells = risk_levels.cells
+    neighbors = risk_levels.neighbors4
 
-if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input15.txt")) as f:
-        risk_levels = [[int(c) for c in line.strip()] for line in f]
+    def get_neighbors(index: int) -> list[tuple[int, int]]:
+        # Entering a cell costs its risk level
+        return [(neighbor, cells[neighbor]) for neighbor in neighbors[index]]
+
+    # Risk levels are between 1 and 9 so a bucket queue beats a heap
+    return search.dial(0, len(cells) - 1, get_neighbors, 9, len(cells)).path
 
+
+def parse_input(f) -> Grid:
+    with loader.map_input(f) as data:
+        return loader.parse_grid(data)
+
+
+def part_one(risk_levels: Grid) -> int:
     lowest_total_risk_path = find_lowest_total_risk_path(risk_levels)
-    print("Part One:")
-    print(sum(risk_levels[i][j] for i, j in lowest_total_risk_path[1:]))
+    return sum(risk_levels.cells[index] for index in lowest_total_risk_path[1:])
 
+
+def part_two(risk_levels: Grid) -> int:
     full_risk_levels = generate_full_risk_levels(risk_levels)
     lowest_total_risk_path = find_lowest_total_risk_path(full_risk_levels)
+    return sum(full_risk_levels.cells[index] for index in lowest_total_risk_path[1:])
+
+
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input15.txt")) as f:
+        risk_levels = parse_input(f)
+
+    print("Part One:")
+    print(part_one(risk_levels))
+
     print("Part Two:")
-    print(sum(full_risk_levels[i][j] for i, j in lowest_total_risk_path[1:]))
+    print(part_two(risk_levels))
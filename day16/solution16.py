@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 import os
-from dataclasses import dataclass, field
 from math import prod
+from typing import NamedTuple
 
 
-@dataclass(frozen=True)
-class Packet:
+class Packet(NamedTuple):
     version: int
     type_id: int
     value: int | None = None
-    subpackets: list["Packet"] = field(default_factory=list)
+    subpackets: tuple["Packet", ...] = ()
 
 
 def parse_input(f) -> str:
@@ -86,7 +85,9 @@ def parse_operator_packet(
 
     bits_consumed += subpackets_bits_consumed
 
-    operator_packet = Packet(version=version, type_id=type_id, subpackets=subpackets)
+    operator_packet = Packet(
+        version=version, type_id=type_id, subpackets=tuple(subpackets)
+    )
 
     return operator_packet, bits_consumed
 
@@ -124,13 +125,22 @@ def sum_packet_version(packet: Packet) -> int:
     return packet_version_sum
 
 
+def part_one(bit_string: str) -> int:
+    packet, _ = parse_packet(bit_string, 0)
+    return sum_packet_version(packet)
+
+
+def part_two(bit_string: str) -> int:
+    packet, _ = parse_packet(bit_string, 0)
+    return evaluate_packet_value(packet)
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input16.txt")) as f:
         bit_string = parse_input(f)
 
-    packet, _ = parse_packet(bit_string, 0)
     print("Part One:")
-    print(sum_packet_version(packet))
+    print(part_one(bit_string))
 
     print("Part Two:")
-    print(evaluate_packet_value(packet))
+    print(part_two(bit_string))
@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
 import os
-import re
 
-INPUT_REGEX_PATTERN = re.compile(
+INPUT_REGEX_PATTERN = (
     r"target area: "
     r"x=(?P<min_x>\d+)\.\.(?P<max_x>\d+), "
     r"y=(?P<min_y>-?\d+)..(?P<max_y>-?\d+)"
@@ -10,7 +9,10 @@ INPUT_REGEX_PATTERN = re.compile(
 
 
 def parse_input(f) -> tuple[int, int, int, int]:
-    m = INPUT_REGEX_PATTERN.match(f.readline().strip())
+    # Deferred as importing re is a large share of the start up time
+    import re
+
+    m = re.match(INPUT_REGEX_PATTERN, f.readline().strip())
     if m is None:
         raise ValueError("Expected input match")
     return (
@@ -69,14 +71,31 @@ def find_initial_velocity_values(
     return initial_velocity_values
 
 
+def part_one(target_area: tuple[int, int, int, int]) -> int:
+    return solve(target_area)[0]
+
+
+def part_two(target_area: tuple[int, int, int, int]) -> int:
+    return solve(target_area)[1]
+
+
+def solve(target_area: tuple[int, int, int, int]) -> tuple[int, int]:
+    # Both parts are answered from the same search over initial velocities
+    initial_velocity_values = find_initial_velocity_values(target_area)
+    return (
+        max(max_trajectory_height(y_0) for _, y_0 in initial_velocity_values),
+        len(initial_velocity_values),
+    )
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input17.txt")) as f:
         target_area = parse_input(f)
 
-    initial_velocity_values = find_initial_velocity_values(target_area)
+    part_one_answer, part_two_answer = solve(target_area)
 
     print("Part One:")
-    print(max(max_trajectory_height(y_0) for _, y_0 in initial_velocity_values))
+    print(part_one_answer)
 
     print("Part Two:")
-    print(len(initial_velocity_values))
+    print(part_two_answer)
@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
-import json
 import os
-from dataclasses import dataclass
 from typing import Optional, Union
 
 
-@dataclass
 class SnailfishNumber:
-    left: Union["SnailfishNumber", int]
-    right: Union["SnailfishNumber", int]
-    parent: Optional["SnailfishNumber"] = None
+    def __init__(
+        self,
+        left: Union["SnailfishNumber", int],
+        right: Union["SnailfishNumber", int],
+        parent: Optional["SnailfishNumber"] = None,
+    ) -> None:
+        self.left = left
+        self.right = right
+        self.parent = parent
 
     def __repr__(self) -> str:
         left_repr = (
@@ -211,28 +214,35 @@ class SnailfishNumber:
 
 
 def parse_input(f) -> list[SnailfishNumber]:
-    return [SnailfishNumber.parse(json.loads(line)) for line in f]
+    # Deferred as importing json is a large share of the start up time
+    import json
 
+    return [SnailfishNumber.parse(json.loads(line)) for line in f]
 
-if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input18.txt")) as f:
-        snailfish_numbers = parse_input(f)
 
+def part_one(snailfish_numbers: list[SnailfishNumber]) -> int:
     added = snailfish_numbers[0]
     for snailfish_number in snailfish_numbers[1:]:
         added = added.add(snailfish_number)
+    return added.magnitude()
 
-    print("Part One:")
-    print(added.magnitude())
 
+def part_two(snailfish_numbers: list[SnailfishNumber]) -> int:
     n = len(snailfish_numbers)
+    return max(
+        snailfish_numbers[i].add(snailfish_numbers[j]).magnitude()
+        for i in range(n)
+        for j in range(n)
+        if i != j
+    )
+
+
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input18.txt")) as f:
+        snailfish_numbers = parse_input(f)
+
+    print("Part One:")
+    print(part_one(snailfish_numbers))
 
     print("Part Two:")
-    print(
-        max(
-            snailfish_numbers[i].add(snailfish_numbers[j]).magnitude()
-            for i in range(n)
-            for j in range(n)
-            if i != j
-        )
-    )
+    print(part_two(snailfish_numbers))
@@ -1,21 +1,21 @@
 #!/usr/bin/env python3
 import os
-from typing import Generator
+from collections.abc import Generator
 
+from aoc import instrument, loader
+
+SCANNER_HEADER_REGEX_PATTERN = rb"--- scanner \d+ ---"
 
-def parse_input(f) -> list[set[tuple[int, int, int]]]:
-    scanners = []
 
-    while f.readline():
-        beacons = set()
-        line = f.readline().strip()
-        while line:
-            x, y, z = [int(s) for s in line.split(",")]
-            beacons.add((x, y, z))
-            line = f.readline().strip()
-        scanners.append(beacons)
+def parse_input(f) -> list[set[tuple[int, int, int]]]:
+    # Deferred as importing re is a large share of the start up time
+    import re
 
-    return scanners
+    with loader.map_input(f) as data:
+        return [
+            {(x, y, z) for x, y, z in loader.parse_records(beacons, 3)}
+            for beacons in re.split(SCANNER_HEADER_REGEX_PATTERN, data)[1:]
+        ]
 
 
 def assemble_full_map(
@@ -34,7 +34,7 @@ def assemble_full_map(
                 candidate_scanner_origin,
             ) in generate_scanner_positions(beacon_map, unknown_scanner):
                 if is_correct_scanner_position(beacon_map, candidate_scanner):
-                    print(f"Matched scanner {index}")
+                    instrument.count("scanners_matched")
                     has_matched_scanner = True
                     beacon_map = beacon_map.union(candidate_scanner)
                     scanner_map.add(candidate_scanner_origin)
@@ -58,11 +58,14 @@ def generate_scanner_positions(
     """Generate all possible scanner positions for the current state
     of the map. Attempts all 24 possible scanner orientations translated
     to line up with each of the existing map beacons."""
+    counting = instrument.ENABLED
     for scanner_orientation in generate_scanner_orientations(original_scanner):
         for (
             scanner_translation,
             scanner_translation_origin,
         ) in generate_scanner_translations(map, scanner_orientation):
+            if counting:
+                instrument.count("candidate_translations")
             yield scanner_translation, scanner_translation_origin
 
 
@@ -115,14 +118,31 @@ def manhattan_distance(v1: tuple[int, int, int], v2: tuple[int, int, int]) -> in
     return abs(v1[0] - v2[0]) + abs(v1[1] - v2[1]) + abs(v1[2] - v2[2])
 
 
+def part_one(scanners: list[set[tuple[int, int, int]]]) -> int:
+    return solve(scanners)[0]
+
+
+def part_two(scanners: list[set[tuple[int, int, int]]]) -> int:
+    return solve(scanners)[1]
+
+
+def solve(scanners: list[set[tuple[int, int, int]]]) -> tuple[int, int]:
+    # Both parts are answered from the same assembled map
+    beacon_map, scanner_map = assemble_full_map(scanners)
+    return (
+        len(beacon_map),
+        max(manhattan_distance(v1, v2) for v1 in scanner_map for v2 in scanner_map),
+    )
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input19.txt")) as f:
         scanners = parse_input(f)
 
-    beacon_map, scanner_map = assemble_full_map(scanners)
+    part_one_answer, part_two_answer = solve(scanners)
 
     print("Part One:")
-    print(len(beacon_map))
+    print(part_one_answer)
 
     print("Part Two:")
-    print(max(manhattan_distance(v1, v2) for v1 in scanner_map for v2 in scanner_map))
+    print(part_two_answer)
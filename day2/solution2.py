@@ -1,5 +1,44 @@
 #!/usr/bin/env python3
+import math
 import os
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import accumulate, compress
+from operator import mul
+from typing import NamedTuple
+
+from aoc import loader
+
+FORWARD = 0
+DOWN = 1
+UP = -1
+OPCODE_TABLE = loader.make_table({"f": FORWARD, "n": DOWN, "u": UP & 0xFF})
+NON_OPCODE_BYTES = bytes(c for c in range(256) if c not in b"fnu")
+FORWARD_MASK_TABLE = bytes(c == FORWARD for c in range(256))
+
+
+class Transform(NamedTuple):
+    """The change in (position, depth, aim) made by a run of commands.
+
+    Every command is an affine update of the state, so a run of them is too:
+    starting from aim a, the run moves position by `position`, depth by
+    `depth + a * position` and aim by `aim`. From the origin these are just the
+    final position, depth and aim."""
+
+    position: int
+    depth: int
+    aim: int
+
+    def then(self, other: "Transform") -> "Transform":
+        """The transform of this run of commands followed by other's."""
+        return Transform(
+            self.position + other.position,
+            self.depth + other.depth + self.aim * other.position,
+            self.aim + other.aim,
+        )
+
+
+IDENTITY = Transform(0, 0, 0)
 
 
 def parse_line(line: str) -> tuple[str, int]:
@@ -7,29 +46,127 @@ def parse_line(line: str) -> tuple[str, int]:
     return split[0], int(split[1])
 
 
-def find_position_and_depth(instructions: list[tuple[str, int]]) -> tuple[int, int]:
-    position = 0
-    depth = 0
+class Commands(NamedTuple):
+    """Commands decoded into parallel arrays of opcodes and amounts.
 
-    for (direction, amount) in instructions:
-        if direction == "forward":
-            position += amount
-        elif direction == "down":
-            depth += amount
-        else:
-            depth -= amount
+    Each opcode is the sign the command's amount changes aim by (0 for
+    forward), so no strings are compared once the input is decoded."""
+
+    opcodes: Sequence[int]
+    amounts: Sequence[int]
+
+    def slice(self, start: int, end: int) -> "Commands":
+        return Commands(self.opcodes[start:end], self.amounts[start:end])
+
+
+def decode_commands(data: loader.Buffer) -> Commands:
+    """Decode every command in a few passes over the whole input.
+
+    Each of "f", "n" and "u" appears in exactly one of the directions, once,
+    so deleting every other byte leaves one opcode byte per command."""
+    opcodes = array("b", data[:].translate(OPCODE_TABLE, NON_OPCODE_BYTES))
+    amounts = array("q", map(int, data[:].split()[1::2]))
+    if len(opcodes) != len(amounts):
+        raise ValueError("Expected a direction and an amount on every line")
+    return Commands(opcodes, amounts)
+
+
+def find_course(commands: Commands) -> Transform:
+    """Find the final position, depth and aim from the origin.
+
+    Aim is the running sum of the signed amounts and depth the dot product of
+    aim with the forward amounts, both computed in C-level iterator
+    pipelines."""
+    opcodes, amounts = commands
+    # The opcode array's buffer holds UP as 0xFF
+    forward = bytes(opcodes).translate(FORWARD_MASK_TABLE)
+    # A forward command leaves aim unchanged, so the running aim after it is
+    # the aim it moved with
+    aims = accumulate(map(mul, opcodes, amounts))
+    return Transform(
+        sum(compress(amounts, forward)),
+        sum(map(mul, compress(aims, forward), compress(amounts, forward))),
+        sum(map(mul, opcodes, amounts)),
+    )
 
-    return position, depth
 
+def combine(transforms: Iterable[Transform]) -> Transform:
+    """Compose transforms in order, pairing neighbours in a balanced tree."""
+    level = list(transforms)
+    if not level:
+        return IDENTITY
+    while len(level) > 1:
+        paired = [a.then(b) for a, b in zip(level[::2], level[1::2])]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
 
-def find_position_and_depth_with_aim(
-    instructions: list[tuple[str, int]]
-) -> tuple[int, int]:
+
+class CourseIndex:
+    """Answers where the submarine is after any number of commands.
+
+    The transforms of every prefix of whole blocks are precomputed, so a query
+    composes one of them with the commands of at most one partial block. With
+    the default block size of about sqrt(n) this takes O(sqrt(n)) time and
+    memory beyond the commands themselves."""
+
+    def __init__(self, commands: Commands, block_size: int | None = None) -> None:
+        n = len(commands.amounts)
+        if block_size is None:
+            block_size = max(1, math.isqrt(n))
+        elif block_size < 1:
+            raise ValueError("Expected a block size of at least 1")
+        self.commands = commands
+        self.block_size = block_size
+        self.prefixes = [IDENTITY]
+        for start in range(0, n - block_size + 1, block_size):
+            block = commands.slice(start, start + block_size)
+            self.prefixes.append(self.prefixes[-1].then(find_course(block)))
+
+    def __len__(self) -> int:
+        return len(self.commands.amounts)
+
+    def transform(self, n: int) -> Transform:
+        """The transform of the first n commands."""
+        if not 0 <= n <= len(self):
+            raise IndexError(f"Expected 0 to {len(self)} commands")
+        block, remainder = divmod(n, self.block_size)
+        start = block * self.block_size
+        return self.prefixes[block].then(
+            find_course(self.commands.slice(start, start + remainder))
+        )
+
+    def position_and_depth(self, n: int) -> tuple[int, int]:
+        """The position and depth (with aim) after the first n commands."""
+        position, depth, _ = self.transform(n)
+        return position, depth
+
+
+def summarise_chunk(path: str, start: int, end: int) -> Transform:
+    with open(path, "rb") as f, loader.map_input(f) as data:
+        return find_course(decode_commands(data[start:end]))
+
+
+def summarise_file(path: str, max_workers: int | None = None) -> Transform:
+    """Summarise a file of commands too large to hold in memory, summarising
+    chunks of it in parallel and composing their transforms.
+
+    Composing two transforms is O(1), so the tree of compositions is cheaper
+    to evaluate here than to ship back out to the workers."""
+    return combine(loader.map_chunks(summarise_chunk, path, max_workers=max_workers))
+
+
+def solve_stream(f) -> tuple[int, int]:
+    """Answer both parts in one pass over the commands."""
     position = 0
     depth = 0
     aim = 0
 
-    for (direction, amount) in instructions:
+    for line in f:
+        if not line.strip():
+            continue
+        direction, amount = parse_line(line)
         if direction == "forward":
             position += amount
             depth += aim * amount
@@ -38,17 +175,44 @@ def find_position_and_depth_with_aim(
         else:
             aim -= amount
 
-    return position, depth
+    # Part one's depth moves exactly as part two's aim does
+    return position * aim, position * depth
+
+
+def solve_file(path: str, max_workers: int | None = None) -> tuple[int, int]:
+    """Answer both parts for a file of commands of any size in a single
+    parallel pass."""
+    position, depth, aim = summarise_file(path, max_workers)
+    return position * aim, position * depth
+
+
+def parse_input(f) -> Commands:
+    with loader.map_input(f) as data:
+        return decode_commands(data)
+
+
+def solve(commands: Commands) -> tuple[int, int]:
+    position, depth, aim = find_course(commands)
+    # Part one's depth moves exactly as part two's aim does
+    return position * aim, position * depth
+
+
+def part_one(commands: Commands) -> int:
+    position, _, aim = find_course(commands)
+    return position * aim
+
+
+def part_two(commands: Commands) -> int:
+    position, depth, _ = find_course(commands)
+    return position * depth
 
 
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input2.txt")) as f:
-        instructions = [parse_line(line) for line in f]
+        commands = parse_input(f)
 
-    position, depth = find_position_and_depth(instructions)
     print("Part One:")
-    print(position * depth)
+    print(part_one(commands))
 
-    position, depth = find_position_and_depth_with_aim(instructions)
     print("Part Two:")
-    print(position * depth)
+    print(part_two(commands))
@@ -1,115 +1,84 @@
 #!/usr/bin/env python3
 import os
 
+from aoc import instrument, loader
+from aoc.grid import Grid
 
-def parse_input(f) -> tuple[str, list[list[str]]]:
-    image_enhancement_algorithm = f.readline().strip()
-    f.readline()
-    input_image = [[c for c in line.strip()] for line in f]
+PIXEL_VALUES = {".": 0, "#": 1}
+PIXEL_TABLE = loader.make_table(PIXEL_VALUES)
+
+
+def parse_input(f) -> tuple[bytes, Grid]:
+    with loader.map_input(f) as data:
+        end = data.find(b"\n")
+        image_enhancement_algorithm = data[:end].strip().translate(PIXEL_TABLE)
+        input_image = loader.parse_grid(data[end:].strip(), values=PIXEL_VALUES)
     return image_enhancement_algorithm, input_image
 
 
 def enhance_image(
-    input_image: list[list[str]],
-    image_enhancement_algorithm: str,
+    input_image: Grid,
+    image_enhancement_algorithm: bytes,
     infinity_is_dark: bool,
-) -> list[list[str]]:
-    m = len(input_image)
-    n = len(input_image[0])
-
+) -> Grid:
     # Only the pixels one level away from the input image depend on
     # the input image hence the output image contains this extra level.
     # Pixels two or more levels away will always be all dark or all
     # light depending on the image enhancement algorithm and the parity.
-    # We modify the input image with one level of infinity pixels for
-    # ease of indexing.
-    modified_input_image = [
-        ["." if infinity_is_dark else "#"] * (n + 2) for _ in range(m + 2)
-    ]
-    for i in range(m):
+    # We pad the input image with two levels of infinity pixels so that
+    # every output pixel's square lies within it.
+    padded = input_image.padded(2, 0 if infinity_is_dark else 1)
+    cells = padded.cells
+    n = padded.n
+    output_image = Grid(input_image.m + 2, input_image.n + 2)
+    output_cells = output_image.cells
+
+    k = 0
+    for i in range(1, padded.m - 1):
+        above, middle, below = (i - 1) * n, i * n, (i + 1) * n
+        # Slide the 3x3 pixel square along the row: shift the two right
+        # columns of the 9-bit index left and add the new right column.
+        index = 0
         for j in range(n):
-            modified_input_image[i + 1][j + 1] = input_image[i][j]
-
-    output_image = [
-        [
-            calculate_enhanced_pixel(
-                modified_input_image,
-                image_enhancement_algorithm,
-                i,
-                j,
-                infinity_is_dark,
+            index = (
+                (index << 1) & 0b110110110
+                | cells[above + j] << 6
+                | cells[middle + j] << 3
+                | cells[below + j]
             )
-            for j in range(n + 2)
-        ]
-        for i in range(m + 2)
-    ]
+            if j >= 2:
+                output_cells[k] = image_enhancement_algorithm[index]
+                k += 1
 
     return output_image
 
 
-def calculate_enhanced_pixel(
-    input_image: list[list[str]],
-    image_enhancement_algorithm: str,
-    i: int,
-    j: int,
-    infinity_is_dark: bool,
-) -> str:
-    pixel_square = get_pixel_square(input_image, i, j, infinity_is_dark)
-    index = int("".join("1" if pixel == "#" else "0" for pixel in pixel_square), 2)
-    return image_enhancement_algorithm[index]
-
-
-def get_pixel_square(
-    input_image: list[list[str]], i: int, j: int, infinity_is_dark: bool
-) -> list[str]:
-    # Note order is important: left to right, top to bottom
-    offsets = [
-        (-1, -1),
-        (-1, 0),
-        (-1, 1),
-        (0, -1),
-        (0, 0),
-        (0, 1),
-        (1, -1),
-        (1, 0),
-        (1, 1),
-    ]
-    return [
-        get_pixel(input_image, i + dx, j + dy, infinity_is_dark) for dx, dy in offsets
-    ]
-
-
-def get_pixel(
-    input_image: list[list[str]],
-    i: int,
-    j: int,
-    infinity_is_dark: bool,
-) -> str:
-    m = len(input_image)
-    n = len(input_image[0])
-    if 0 <= i < m and 0 <= j < n:
-        return input_image[i][j]
-    else:
-        return "." if infinity_is_dark else "#"
+def count_lit_pixels(
+    image_enhancement_algorithm: bytes, input_image: Grid, steps: int
+) -> int:
+    enhanced = input_image
+    for i in range(steps):
+        # The input flips infinity between dark and light
+        with instrument.timer("enhance_image"):
+            enhanced = enhance_image(enhanced, image_enhancement_algorithm, i % 2 == 0)
+        instrument.count("enhance_steps")
+    return sum(enhanced.cells)
+
+
+def part_one(image: tuple[bytes, Grid]) -> int:
+    return count_lit_pixels(*image, 2)
+
+
+def part_two(image: tuple[bytes, Grid]) -> int:
+    return count_lit_pixels(*image, 50)
 
 
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input20.txt")) as f:
-        image_enhancement_algorithm, input_image = parse_input(f)
-
-    enhanced = input_image
-    for i in range(2):
-        # The input flips infinity between dark and light
-        enhanced = enhance_image(enhanced, image_enhancement_algorithm, i % 2 == 0)
+        image = parse_input(f)
 
     print("Part One:")
-    print(sum(pixel == "#" for row in enhanced for pixel in row))
-
-    enhanced = input_image
-    for i in range(50):
-        print(f"Enhance {i + 1}")
-        # The input flips infinity between dark and light
-        enhanced = enhance_image(enhanced, image_enhancement_algorithm, i % 2 == 0)
+    print(part_one(image))
 
     print("Part Two:")
-    print(sum(pixel == "#" for row in enhanced for pixel in row))
+    print(part_two(image))
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import os
+from collections.abc import Callable
 from functools import cache
-from typing import Callable
 
 THREE_ROLLS_OUTCOMES = {
     3: 1,  # 1-1-1
@@ -89,21 +89,29 @@ def move_player_position(player_position: int, amount: int) -> int:
     return ((player_position - 1 + amount) % 10) + 1
 
 
-if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input21.txt")) as f:
-        player1_start, player2_start = parse_input(f)
-
+def part_one(player_starts: tuple[int, int]) -> int:
+    player1_start, player2_start = player_starts
     deterministic_dice = DeterministicDice()
     player1_score, player2_score, number_of_rolls = play_dirac_dice(
         player1_start, player2_start, deterministic_dice.roll
     )
+    return min(player1_score, player2_score) * number_of_rolls
 
-    print("Part One:")
-    print(min(player1_score, player2_score) * number_of_rolls)
 
+def part_two(player_starts: tuple[int, int]) -> int:
+    player1_start, player2_start = player_starts
     player1_wins, player2_wins = calculate_number_of_wins(
         player1_start, 0, player2_start, 0
     )
+    return max(player1_wins, player2_wins)
+
+
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input21.txt")) as f:
+        player_starts = parse_input(f)
+
+    print("Part One:")
+    print(part_one(player_starts))
 
     print("Part Two:")
-    print(max(player1_wins, player2_wins))
+    print(part_two(player_starts))
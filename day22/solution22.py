@@ -1,19 +1,13 @@
 #!/usr/bin/env python3
 import os
-import re
-from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, NamedTuple
 
-INPUT_REGEX_PATTERN = re.compile(
-    r"(?P<on_or_off>on|off) "
-    r"x=(?P<min_x>-?\d+)\.\.(?P<max_x>-?\d+),"
-    r"y=(?P<min_y>-?\d+)..(?P<max_y>-?\d+),"
-    r"z=(?P<min_z>-?\d+)..(?P<max_z>-?\d+)"
-)
+from aoc import instrument, loader
 
+ON_OR_OFF_REGEX_PATTERN = rb"^(on|off) "
 
-@dataclass(frozen=True)
-class Cuboid:
+
+class Cuboid(NamedTuple):
     x1: int
     x2: int
     y1: int
@@ -144,21 +138,22 @@ RebootStep = tuple[Literal["on", "off"], Cuboid]
 def parse_input(
     f,
 ) -> list[RebootStep]:
+    # Deferred as importing re is a large share of the start up time
+    import re
+
+    with loader.map_input(f) as data:
+        on_or_offs = re.findall(ON_OR_OFF_REGEX_PATTERN, data, re.MULTILINE)
+        records = loader.parse_records(data, 6)
+    if len(on_or_offs) != len(records):
+        raise ValueError("Expected input match")
+
     reboot_steps: list[RebootStep] = []
-    for line in f:
-        m = INPUT_REGEX_PATTERN.match(line.strip())
-        if m is None:
-            raise ValueError("Expected input match")
+    for on_or_off, (min_x, max_x, min_y, max_y, min_z, max_z) in zip(
+        on_or_offs, records
+    ):
         reboot_step: RebootStep = (
-            "on" if m.group("on_or_off") == "on" else "off",
-            Cuboid(
-                x1=int(m.group("min_x")),
-                x2=int(m.group("max_x")),
-                y1=int(m.group("min_y")),
-                y2=int(m.group("max_y")),
-                z1=int(m.group("min_z")),
-                z2=int(m.group("max_z")),
-            ),
+            "on" if on_or_off == b"on" else "off",
+            Cuboid(x1=min_x, x2=max_x, y1=min_y, y2=max_y, z1=min_z, z2=max_z),
         )
         reboot_steps.append(reboot_step)
     return reboot_steps
@@ -201,6 +196,8 @@ def count_cubes_on_restricted(reboot_steps: list[RebootStep]) -> int:
 
 def count_cubes_on_full(reboot_steps: list[RebootStep]) -> int:
     cuboids: set[Cuboid] = set()
+    counting = instrument.ENABLED
+    cuboid_splits = 0
     for on_or_off, cuboid in reboot_steps:
         new_cuboids: set[Cuboid] = set()
         # If we are turning off a cuboid we remove the cuboid from
@@ -212,16 +209,28 @@ def count_cubes_on_full(reboot_steps: list[RebootStep]) -> int:
             new_cuboids.add(cuboid)
         for existing_cuboid in cuboids:
             new_cuboids.update(existing_cuboid.remove(cuboid))
+            if counting and existing_cuboid.intersects(cuboid):
+                cuboid_splits += 1
         cuboids = new_cuboids
+    if counting:
+        instrument.count("cuboid_splits", cuboid_splits)
     return sum(cuboid.volume() for cuboid in cuboids)
 
 
+def part_one(reboot_steps: list[RebootStep]) -> int:
+    return count_cubes_on_restricted(reboot_steps)
+
+
+def part_two(reboot_steps: list[RebootStep]) -> int:
+    return count_cubes_on_full(reboot_steps)
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input22.txt")) as f:
         reboot_steps = parse_input(f)
 
     print("Part One:")
-    print(count_cubes_on_restricted(reboot_steps))
+    print(part_one(reboot_steps))
 
     print("Part Two:")
-    print(count_cubes_on_full(reboot_steps))
+    print(part_two(reboot_steps))
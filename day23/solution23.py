@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
-import heapq
-import math
 import os
-from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Generator, Generic, Literal, TypeGuard, TypeVar
+from collections.abc import Generator
+from typing import Literal, NamedTuple, TypeGuard
+
+from aoc import search
 
 Amphipod = Literal["A", "B", "C", "D"]
 ShortRoom = tuple[Amphipod | None, Amphipod | None]
@@ -29,32 +28,22 @@ ENERGY_COST: dict[Amphipod, int] = {
     "C": 100,
     "D": 1000,
 }
-
-T = TypeVar("T")
-
-
-@dataclass(order=True)
-class PrioritizedItem(Generic[T]):
-    priority: int
-    item: T = field(compare=False)
+HALLWAY_POSITION_INDEX: dict[Amphipod, int] = {
+    "A": 2,
+    "B": 4,
+    "C": 6,
+    "D": 8,
+}
+INVALID_HALLWAY_POSITIONS = set([2, 4, 6, 8])
 
 
-@dataclass(frozen=True)
-class AmphipodBurrow:
+class AmphipodBurrow(NamedTuple):
     room_a: LongRoom | ShortRoom
     room_b: LongRoom | ShortRoom
     room_c: LongRoom | ShortRoom
     room_d: LongRoom | ShortRoom
     hallway: Hallway
 
-    _hallway_position_index = {
-        "A": 2,
-        "B": 4,
-        "C": 6,
-        "D": 8,
-    }
-    _invalid_hallway_positions = set([2, 4, 6, 8])
-
     def __repr__(self) -> str:
         lines = []
         lines.append("".join(self.print_amphipod(space) for space in self.hallway))
@@ -85,6 +74,33 @@ class AmphipodBurrow:
         elif room_type == "D":
             return self.room_d
 
+    def get_minimum_energy_to_organize(self) -> int:
+        """A lower bound on the energy left to organize the burrow, counting
+        only the steps each misplaced amphipod needs to reach its own room if
+        nothing were in its way. No move costs less than it lowers this by, so
+        it is a consistent heuristic for the search."""
+        energy = 0
+        for hallway_index, amphipod in enumerate(self.hallway):
+            if amphipod is not None:
+                target_index = HALLWAY_POSITION_INDEX[amphipod]
+                energy += ENERGY_COST[amphipod] * (
+                    abs(hallway_index - target_index) + 1
+                )
+
+        for room_type in AMPHIPODS:
+            room = self.get_room(room_type)
+            outside_room_index = HALLWAY_POSITION_INDEX[room_type]
+            for room_index, room_amphipod in enumerate(room):
+                if room_amphipod is not None and room_amphipod != room_type:
+                    target_index = HALLWAY_POSITION_INDEX[room_amphipod]
+                    energy += ENERGY_COST[room_amphipod] * (
+                        len(room)
+                        - room_index
+                        + abs(outside_room_index - target_index)
+                        + 1
+                    )
+        return energy
+
     def get_possible_moves(
         self,
     ) -> Generator[tuple["AmphipodBurrow", int], None, None]:
@@ -113,10 +129,10 @@ class AmphipodBurrow:
 
         amphipod, steps_to_leave_room, next_room = target
 
-        outside_room_index = self._hallway_position_index[room_type]
+        outside_room_index = HALLWAY_POSITION_INDEX[room_type]
         to_left_index = outside_room_index - 1
         while to_left_index >= 0 and self.hallway[to_left_index] is None:
-            if to_left_index not in self._invalid_hallway_positions:
+            if to_left_index not in INVALID_HALLWAY_POSITIONS:
                 next_hallway = get_next_hallway(self.hallway, to_left_index, amphipod)
                 next_amphipod_burrow = AmphipodBurrow(
                     room_a=next_room if room_type == "A" else self.room_a,
@@ -135,7 +151,7 @@ class AmphipodBurrow:
         while (
             to_right_index < len(self.hallway) and self.hallway[to_right_index] is None
         ):
-            if to_right_index not in self._invalid_hallway_positions:
+            if to_right_index not in INVALID_HALLWAY_POSITIONS:
                 next_hallway = get_next_hallway(self.hallway, to_right_index, amphipod)
                 next_amphipod_burrow = AmphipodBurrow(
                     room_a=next_room if room_type == "A" else self.room_a,
@@ -231,7 +247,7 @@ class AmphipodBurrow:
 
         steps_to_enter_room, next_room = target
 
-        outside_room_index = self._hallway_position_index[amphipod]
+        outside_room_index = HALLWAY_POSITION_INDEX[amphipod]
         a, b = (
             (hallway_index + 1, outside_room_index)
             if hallway_index <= outside_room_index
@@ -355,38 +371,19 @@ def parse_input(
 def find_least_energy_to_organize(
     initial_amphipod_burrow: AmphipodBurrow, target: AmphipodBurrow
 ) -> int:
-    visited: set[AmphipodBurrow] = set()
-    distances: dict[AmphipodBurrow, float] = defaultdict(lambda: math.inf)
-    priority_queue: list[PrioritizedItem[AmphipodBurrow]] = []
-
-    distances[initial_amphipod_burrow] = 0
-    heapq.heappush(priority_queue, PrioritizedItem(0, initial_amphipod_burrow))
-
-    while priority_queue:
-        item = heapq.heappop(priority_queue)
-        current_energy_cost, current_amphipod_burrow = item.priority, item.item
-        visited.add(current_amphipod_burrow)
-
-        for (
-            next_amphipod_burrow,
-            energy_cost,
-        ) in current_amphipod_burrow.get_possible_moves():
-            if next_amphipod_burrow not in visited:
-                candidate_energy_cost = current_energy_cost + energy_cost
-                if candidate_energy_cost < distances[next_amphipod_burrow]:
-                    distances[next_amphipod_burrow] = candidate_energy_cost
-                    heapq.heappush(
-                        priority_queue,
-                        PrioritizedItem(candidate_energy_cost, next_amphipod_burrow),
-                    )
-
-    return int(distances[target])
+    result = search.dijkstra(
+        initial_amphipod_burrow,
+        target,
+        AmphipodBurrow.get_possible_moves,
+        AmphipodBurrow.get_minimum_energy_to_organize,
+    )
+    if result.distance is None:
+        raise ValueError("Expected the amphipods to be organizable")
+    return result.distance
 
 
-if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input23.txt")) as f:
-        initial_short_amphipod_burrow, initial_long_amphipod_burrow = parse_input(f)
-
+def part_one(amphipod_burrows: tuple[AmphipodBurrow, AmphipodBurrow]) -> int:
+    initial_short_amphipod_burrow, _ = amphipod_burrows
     completed_short_amphipod_burrow = AmphipodBurrow(
         room_a=("A", "A"),
         room_b=("B", "B"),
@@ -394,13 +391,13 @@ if __name__ == "__main__":
         room_d=("D", "D"),
         hallway=(None,) * 11,
     )
-    print("Part One:")
-    print(
-        find_least_energy_to_organize(
-            initial_short_amphipod_burrow, completed_short_amphipod_burrow
-        )
+    return find_least_energy_to_organize(
+        initial_short_amphipod_burrow, completed_short_amphipod_burrow
     )
 
+
+def part_two(amphipod_burrows: tuple[AmphipodBurrow, AmphipodBurrow]) -> int:
+    _, initial_long_amphipod_burrow = amphipod_burrows
     completed_long_amphipod_burrow = AmphipodBurrow(
         room_a=("A", "A", "A", "A"),
         room_b=("B", "B", "B", "B"),
@@ -413,10 +410,17 @@ if __name__ == "__main__":
         room_d=("D", "D", "D", "D"),
         hallway=(None,) * 11,
     )
+    return find_least_energy_to_organize(
+        initial_long_amphipod_burrow, completed_long_amphipod_burrow
+    )
+
+
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input23.txt")) as f:
+        amphipod_burrows = parse_input(f)
+
+    print("Part One:")
+    print(part_one(amphipod_burrows))
 
     print("Part Two:")
-    print(
-        find_least_energy_to_organize(
-            initial_long_amphipod_burrow, completed_long_amphipod_burrow
-        )
-    )
+    print(part_two(amphipod_burrows))
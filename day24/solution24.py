@@ -255,10 +255,11 @@ def is_model_number_valid_formula(model_number: int) -> bool:
     return z == 0
 
 
-if __name__ == "__main__":
-    with open(os.path.join(os.path.dirname(__file__), "input24.txt")) as f:
-        program = [parse_instruction(line) for line in f]
+def parse_input(f) -> list[Instruction]:
+    return [parse_instruction(line) for line in f]
+
 
+def part_one(program: list[Instruction]) -> int:
     # Highest possible number:
     #
     # w5 = w4 - 6
@@ -301,9 +302,10 @@ if __name__ == "__main__":
     elif not is_model_number_valid_formula(highest_valid_number):
         raise ValueError("Expected model number to be valid")
 
-    print("Part One:")
-    print(highest_valid_number)
+    return highest_valid_number
+
 
+def part_two(program: list[Instruction]) -> int:
     # Lowest possible number:
     #
     # w5 = w4 - 6
@@ -346,5 +348,15 @@ if __name__ == "__main__":
     elif not is_model_number_valid_formula(lowest_valid_number):
         raise ValueError("Expected model number to be valid")
 
+    return lowest_valid_number
+
+
+if __name__ == "__main__":
+    with open(os.path.join(os.path.dirname(__file__), "input24.txt")) as f:
+        program = parse_input(f)
+
+    print("Part One:")
+    print(part_one(program))
+
     print("Part Two:")
-    print(lowest_valid_number)
+    print(part_two(program))
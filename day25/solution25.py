@@ -1,8 +1,16 @@
 #!/usr/bin/env python3
 import os
 
+from aoc import loader
+from aoc.grid import Grid
 
-def count_steps_until_stationary(sea_cucumber_grid: list[list[str]]) -> int:
+EMPTY = 0
+EAST_FACING = 1
+SOUTH_FACING = 2
+SEA_CUCUMBER_VALUES = {".": EMPTY, ">": EAST_FACING, "v": SOUTH_FACING}
+
+
+def count_steps_until_stationary(sea_cucumber_grid: Grid) -> int:
     steps = 0
     moves = -1
     while moves != 0:
@@ -11,44 +19,56 @@ def count_steps_until_stationary(sea_cucumber_grid: list[list[str]]) -> int:
     return steps
 
 
-def step(sea_cucumber_grid: list[list[str]]) -> tuple[list[list[str]], int]:
-    m = len(sea_cucumber_grid)
-    n = len(sea_cucumber_grid[0])
-    next_sea_cucumber_grid = [["."] * n for _ in range(m)]
+def step(sea_cucumber_grid: Grid) -> tuple[Grid, int]:
+    cells = sea_cucumber_grid.cells
+    east = sea_cucumber_grid.offsets(0, 1)
+    south = sea_cucumber_grid.offsets(1, 0)
+    next_sea_cucumber_grid = Grid(sea_cucumber_grid.m, sea_cucumber_grid.n, wrap=True)
+    next_cells = next_sea_cucumber_grid.cells
     moves = 0
 
     # Move east-facing herd
-    for i in range(m):
-        for j in range(n):
-            if sea_cucumber_grid[i][j] == ">":
-                if sea_cucumber_grid[i][(j + 1) % n] == ".":
-                    next_sea_cucumber_grid[i][(j + 1) % n] = ">"
-                    moves += 1
-                else:
-                    next_sea_cucumber_grid[i][j] = ">"
+    for index, cell in enumerate(cells):
+        if cell == EAST_FACING:
+            target = east[index]
+            if cells[target] == EMPTY:
+                next_cells[target] = EAST_FACING
+                moves += 1
+            else:
+                next_cells[index] = EAST_FACING
 
     # Move south-facing herd
-    for i in range(m):
-        for j in range(n):
-            if sea_cucumber_grid[i][j] == "v":
-                if (
-                    sea_cucumber_grid[(i + 1) % m][j] != "v"
-                    and next_sea_cucumber_grid[(i + 1) % m][j] == "."
-                ):
-                    next_sea_cucumber_grid[(i + 1) % m][j] = "v"
-                    moves += 1
-                else:
-                    next_sea_cucumber_grid[i][j] = "v"
+    for index, cell in enumerate(cells):
+        if cell == SOUTH_FACING:
+            target = south[index]
+            if cells[target] != SOUTH_FACING and next_cells[target] == EMPTY:
+                next_cells[target] = SOUTH_FACING
+                moves += 1
+            else:
+                next_cells[index] = SOUTH_FACING
 
     return next_sea_cucumber_grid, moves
 
 
+def parse_input(f) -> Grid:
+    with loader.map_input(f) as data:
+        return loader.parse_grid(data, values=SEA_CUCUMBER_VALUES, wrap=True)
+
+
+def part_one(sea_cucumber_grid: Grid) -> int:
+    return count_steps_until_stationary(sea_cucumber_grid)
+
+
+def part_two(sea_cucumber_grid: Grid) -> str:
+    return "Complete every other star!"
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input25.txt")) as f:
-        sea_cucumber_grid = [[c for c in line.strip()] for line in f]
+        sea_cucumber_grid = parse_input(f)
 
     print("Part One:")
-    print(count_steps_until_stationary(sea_cucumber_grid))
+    print(part_one(sea_cucumber_grid))
 
     print("Part Two:")
-    print("Complete every other star!")
+    print(part_two(sea_cucumber_grid))
@@ -1,73 +1,218 @@
 #!/usr/bin/env python3
 import os
-
-
-def find_gamma_and_epsilon_rate(binary_numbers: list[list[int]]) -> tuple[int, int]:
-    one_counts = [0] * 12
-
-    for binary_number in binary_numbers:
-        for i in range(12):
-            one_counts[i] += binary_number[i]
-
-    gamma_rate_bits = [0] * 12
-    epsilon_rate_bits = [0] * 12
-
-    for i in range(12):
-        count = one_counts[i]
-        if count > len(binary_numbers) / 2:
-            gamma_rate_bits[i] = 1
-        else:
-            epsilon_rate_bits[i] = 1
-
-    gamma_rate = bit_array_to_decimal(gamma_rate_bits)
-    epsilon_rate = bit_array_to_decimal(epsilon_rate_bits)
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Sequence
+from itertools import accumulate, repeat
+from typing import NamedTuple
+
+from aoc import loader
+
+# Byte values to their kth bit
+BIT_TABLES = [bytes(x >> k & 1 for x in range(256)) for k in range(8)]
+
+
+class Report(NamedTuple):
+    """A diagnostic report of binary numbers of the same width, each packed
+    into an int. Reports up to 64 bits wide are stored in an array of
+    machine words."""
+
+    numbers: Sequence[int]
+    width: int
+
+
+def count_one_bits(report: Report) -> list[int]:
+    """Count the numbers with each bit set, least significant bit first.
+
+    Rather than extracting bits number by number, each byte of every word is
+    sliced out of the array's buffer in one pass and each of its bits counted
+    with a translate and a count, so every pass runs in C."""
+    numbers, width = report
+    if not isinstance(numbers, array):
+        return [sum(x >> i & 1 for x in numbers) for i in range(width)]
+
+    words = numbers.tobytes()
+    size = numbers.itemsize
+    counts = []
+    for j in range(0, width, 8):
+        offset = j // 8 if sys.byteorder == "little" else size - 1 - j // 8
+        column = words[offset::size]
+        for k in range(min(8, width - j)):
+            counts.append(column.translate(BIT_TABLES[k]).count(1))
+    return counts
+
+
+def find_gamma_and_epsilon_rate(report: Report) -> tuple[int, int]:
+    gamma_rate = 0
+    for i, count in enumerate(count_one_bits(report)):
+        if count > len(report.numbers) / 2:
+            gamma_rate |= 1 << i
+    epsilon_rate = gamma_rate ^ ((1 << report.width) - 1)
     return gamma_rate, epsilon_rate
 
 
-def find_oxygen_generator_rating(binary_numbers: list[list[int]]) -> int:
-    return find_rating(binary_numbers, True)
-
-
-def find_co2_scrubber_rating(binary_numbers: list[list[int]]) -> int:
-    return find_rating(binary_numbers, False)
-
-
-def find_rating(binary_numbers: list[list[int]], most_common: bool):
-    candidates = binary_numbers
-    for i in range(12):
-        if len(candidates) == 1:
+class RatingIndex:
+    """The report's numbers sorted once, to answer rating queries.
+
+    The candidates sharing a prefix of bits are a contiguous range of the
+    sorted numbers, and those with the next bit set are the end of that range
+    from the first number at least prefix | bit. So each bit criterion is a
+    bisect which narrows the range, and a rating takes O(width log n) time
+    without building any candidate lists. Ratings are cached once found."""
+
+    def __init__(self, report: Report) -> None:
+        numbers = sorted(report.numbers)
+        self.numbers: Sequence[int] = (
+            array("Q", numbers) if report.width <= 64 else numbers
+        )
+        self.width = report.width
+        self.ratings: dict[bool, int] = {}
+
+    def rating(self, most_common: bool) -> int:
+        if most_common not in self.ratings:
+            self.ratings[most_common] = self.find_rating(most_common)
+        return self.ratings[most_common]
+
+    def find_rating(self, most_common: bool) -> int:
+        numbers = self.numbers
+        low, high = 0, len(numbers)
+        prefix = 0
+        for i in range(self.width - 1, -1, -1):
+            if high - low == 1:
+                break
+
+            bit = 1 << i
+            middle = bisect_left(numbers, prefix | bit, low, high)
+            one_bit_count = high - middle
+            has_more_or_equal_one_bits = one_bit_count >= (high - low + 1) // 2
+
+            if has_more_or_equal_one_bits == most_common:
+                low = middle
+                prefix |= bit
+            else:
+                high = middle
+
+        if high - low != 1:
+            raise ValueError("Expected exactly one candidate left")
+
+        return numbers[low]
+
+
+def find_oxygen_generator_rating(index: RatingIndex) -> int:
+    return index.rating(True)
+
+
+def find_co2_scrubber_rating(index: RatingIndex) -> int:
+    return index.rating(False)
+
+
+def find_rating_from_counts(
+    values: Sequence[int], counts: Sequence[int], width: int, most_common: bool
+) -> int:
+    """Find a rating from the sorted distinct values of a fixed width and the
+    number of times each occurs. As in RatingIndex, the candidates sharing a
+    prefix are a contiguous range of the values, so each bit criterion is a
+    bisect which narrows the range, with the candidates counted from prefix
+    sums of the counts."""
+    prefix_sums = list(accumulate(counts, initial=0))
+    low, high = 0, len(values)
+    prefix = 0
+    for i in range(width - 1, -1, -1):
+        candidate_count = prefix_sums[high] - prefix_sums[low]
+        if candidate_count == 1:
             break
 
-        bit_sum = sum(x[i] for x in candidates)
-        has_more_or_equal_one_bits = bit_sum >= (len(candidates) + 1) // 2
+        bit = 1 << i
+        middle = bisect_left(values, prefix | bit, low, high)
+        one_bit_count = prefix_sums[high] - prefix_sums[middle]
+        has_more_or_equal_one_bits = one_bit_count >= (candidate_count + 1) // 2
 
-        if most_common:
-            dominant_bit = 1 if has_more_or_equal_one_bits else 0
+        if has_more_or_equal_one_bits == most_common:
+            low = middle
+            prefix |= bit
         else:
-            dominant_bit = 0 if has_more_or_equal_one_bits else 1
+            high = middle
 
-        candidates = [x for x in candidates if x[i] == dominant_bit]
-
-    if len(candidates) != 1:
+    if prefix_sums[high] - prefix_sums[low] != 1:
         raise ValueError("Expected exactly one candidate left")
 
-    return bit_array_to_decimal(candidates[0])
-
-
-def bit_array_to_decimal(bit_array: list[int]) -> int:
-    return int("".join([str(x) for x in bit_array]), 2)
+    return values[low]
+
+
+def solve_stream(f) -> tuple[int, int]:
+    """Answer both parts in one pass over the report, keeping the count of
+    one bits in each position and how often each distinct number occurs
+    rather than every line, so memory is bounded by the distinct numbers
+    instead of the length of the report."""
+    width = 0
+    # The count of one bits in each position, most significant bit first
+    one_counts: list[int] = []
+    number_counts: Counter[int] = Counter()
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        if not number_counts:
+            width = len(line)
+            one_counts = [0] * width
+        elif len(line) != width:
+            raise ValueError(f"Expected binary numbers of width {width}")
+        for i, char in enumerate(line):
+            if char == "1":
+                one_counts[i] += 1
+        number_counts[int(line, 2)] += 1
+
+    if not number_counts:
+        raise ValueError("Expected at least one binary number")
+
+    total = number_counts.total()
+    gamma_rate = 0
+    for count in one_counts:
+        gamma_rate = gamma_rate << 1 | (count > total / 2)
+    epsilon_rate = gamma_rate ^ ((1 << width) - 1)
+
+    values = sorted(number_counts)
+    counts = list(map(number_counts.__getitem__, values))
+    oxygen_generator_rating = find_rating_from_counts(values, counts, width, True)
+    co2_scrubber_rating = find_rating_from_counts(values, counts, width, False)
+    return gamma_rate * epsilon_rate, oxygen_generator_rating * co2_scrubber_rating
+
+
+def parse_input(f) -> Report:
+    with loader.map_input(f) as data:
+        lines = data[:].split()
+    if not lines:
+        raise ValueError("Expected at least one binary number")
+    width = len(lines[0])
+    if set(map(len, lines)) != {width}:
+        raise ValueError(f"Expected binary numbers of width {width}")
+
+    numbers = map(int, lines, repeat(2))
+    if width <= 64:
+        return Report(array("Q", numbers), width)
+    return Report(list(numbers), width)
+
+
+def part_one(report: Report) -> int:
+    gamma_rate, epsilon_rate = find_gamma_and_epsilon_rate(report)
+    return gamma_rate * epsilon_rate
+
+
+def part_two(report: Report) -> int:
+    index = RatingIndex(report)
+    oxygen_generator_rating = find_oxygen_generator_rating(index)
+    co2_scrubber_rating = find_co2_scrubber_rating(index)
+    return oxygen_generator_rating * co2_scrubber_rating
 
 
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input3.txt")) as f:
-        binary_numbers = [[int(c) for c in line.strip()] for line in f]
+        report = parse_input(f)
 
-    gamma_rate, epsilon_rate = find_gamma_and_epsilon_rate(binary_numbers)
     print("Part One:")
-    print(gamma_rate * epsilon_rate)
+    print(part_one(report))
 
-    oxygen_generator_rating = find_oxygen_generator_rating(binary_numbers)
-    co2_scrubber_rating = find_co2_scrubber_rating(binary_numbers)
-    life_support_rating = oxygen_generator_rating * co2_scrubber_rating
     print("Part Two:")
-    print(life_support_rating)
+    print(part_two(report))
@@ -1,104 +1,189 @@
 #!/usr/bin/env python3
 import os
-
-Board = list[list[int]]
-BoardMarks = list[list[int]]
-
-
-def parse_boards(f) -> tuple[list[int], list[Board], list[BoardMarks]]:
-    numbers = [int(x) for x in f.readline().strip().split(",")]
-
-    boards = []
-    boards_marks = []
-
-    rest = f.readlines()
-    for i in range(len(rest) // 6):
-        board_lines = rest[(6 * i + 1) : (6 * i + 6)]
-        board = [[int(x) for x in line.strip().split()] for line in board_lines]
-        board_marks = [([0] * 5) for _ in range(5)]
-
-        boards.append(board)
-        boards_marks.append(board_marks)
-
-    return numbers, boards, boards_marks
-
-
-def find_first_winning_board_score(
-    boards: list[Board],
-    boards_marks: list[BoardMarks],
-    numbers: list[int],
-) -> int:
-    for number in numbers:
-        for board, board_marks in zip(boards, boards_marks):
-            mark_board(board, board_marks, number)
-            if has_board_won(board_marks):
-                return calculate_winning_score(board, board_marks, number)
-    return -1
-
-
-def find_last_winning_board_score(
-    boards: list[Board],
-    boards_marks: list[BoardMarks],
-    numbers: list[int],
-) -> int:
-    winning_scores = []
-    boards_won = [False] * len(boards)
-
-    for number in numbers:
-        for i in range(len(boards)):
-            board = boards[i]
-            board_marks = boards_marks[i]
-            board_won = boards_won[i]
-
-            if board_won:
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import repeat
+from typing import NamedTuple
+
+from aoc import loader
+
+SIZE = 5
+BOARD_CELLS = SIZE * SIZE
+# The first cell and step between cells of every row and column of a board
+LINES = [(row * SIZE, 1) for row in range(SIZE)] + [
+    (column, SIZE) for column in range(SIZE)
+]
+
+
+class Bingo(NamedTuple):
+    numbers: list[int]
+    # The boards' numbers row by row, BOARD_CELLS per board
+    cells: Sequence[int]
+
+    @property
+    def board_count(self) -> int:
+        return len(self.cells) // BOARD_CELLS
+
+
+class BingoIndex:
+    """Marks drawn numbers on every board at once.
+
+    Each number maps to the cells containing it, and each row and column of
+    every board keeps a count of its marked cells, so a draw only touches the
+    cells with that number and a board wins when one of its counts reaches
+    SIZE. Each board's sum of unmarked numbers is kept as cells are marked,
+    so scores need no scan either."""
+
+    def __init__(self, cells: Sequence[int]) -> None:
+        self.cells_by_number: dict[int, list[int]] = defaultdict(list)
+        for cell, number in enumerate(cells):
+            self.cells_by_number[number].append(cell)
+
+        board_count = len(cells) // BOARD_CELLS
+        self.row_hits = bytearray(board_count * SIZE)
+        self.column_hits = bytearray(board_count * SIZE)
+        self.unmarked_sums = [
+            sum(cells[start : start + BOARD_CELLS])
+            for start in range(0, len(cells), BOARD_CELLS)
+        ]
+        self.won = bytearray(board_count)
+
+    def draw(self, number: int) -> list[int]:
+        """Mark number on every board, returning the boards which win with it
+        in board order."""
+        winners = []
+        won = self.won
+        row_hits = self.row_hits
+        column_hits = self.column_hits
+        unmarked_sums = self.unmarked_sums
+        # Cells are marked at most once, even if the number is drawn again
+        for cell in self.cells_by_number.pop(number, ()):
+            board, position = divmod(cell, BOARD_CELLS)
+            if won[board]:
                 continue
 
-            mark_board(board, board_marks, number)
-            if has_board_won(board_marks):
-                boards_won[i] = True
-                winning_scores.append(
-                    calculate_winning_score(board, board_marks, number)
-                )
-
-    return winning_scores[-1]
-
-
-def mark_board(board: Board, board_marks: BoardMarks, number: int) -> None:
-    for i in range(5):
-        for j in range(5):
-            if board[i][j] == number:
-                board_marks[i][j] = 1
-
-
-def has_board_won(board_marks: BoardMarks) -> bool:
-    for i in range(5):
-        row = board_marks[i]
-        if all(row):
-            return True
-    for j in range(5):
-        column = [board_marks[i][j] for i in range(5)]
-        if all(column):
-            return True
-    return False
-
-
-def calculate_winning_score(
-    board: Board, board_marks: BoardMarks, winning_number: int
-) -> int:
-    score = 0
-    for i in range(5):
-        for j in range(5):
-            if not board_marks[i][j]:
-                score += board[i][j]
-    return score * winning_number
+            unmarked_sums[board] -= number
+            row = board * SIZE + position // SIZE
+            column = board * SIZE + position % SIZE
+            row_hits[row] += 1
+            column_hits[column] += 1
+            if row_hits[row] == SIZE or column_hits[column] == SIZE:
+                won[board] = 1
+                winners.append(board)
+        return winners
+
+    def play(self, numbers: Iterable[int]) -> Iterator[tuple[int, int]]:
+        """Draw the numbers in turn, yielding each board and its score as it
+        wins."""
+        for number in numbers:
+            for board in self.draw(number):
+                yield board, self.unmarked_sums[board] * number
+
+
+class BingoWins:
+    """Works out when every board wins straight from the draw order, without
+    playing the game.
+
+    A line is complete on the turn its last number is first drawn, and a board
+    wins on the earliest turn one of its lines is complete: the minimum over
+    its lines of the maximum draw turn of their cells. Its score then only
+    needs the cells drawn after that turn. Boards which never win have a win
+    turn of len(numbers).
+
+    Each line's maxima are taken for every board at once by mapping max over
+    strided slices of the cells' turns."""
+
+    def __init__(self, bingo: Bingo) -> None:
+        self.bingo = bingo
+        numbers, cells = bingo
+        never = len(numbers)
+        first_turns: dict[int, int] = {}
+        for turn, number in enumerate(numbers):
+            first_turns.setdefault(number, turn)
+        cell_turns = list(map(first_turns.get, cells, repeat(never)))
+        line_maxima = []
+        for start, step in LINES:
+            # The turns of one cell of this line on every board
+            line = [cell_turns[start + step * i :: BOARD_CELLS] for i in range(SIZE)]
+            line_maxima.append(map(max, *line))
+        self.cell_turns = cell_turns
+        self.win_turns = list(map(min, *line_maxima))
+        self.winners = [
+            board for board, turn in enumerate(self.win_turns) if turn < never
+        ]
+
+    def __len__(self) -> int:
+        return len(self.winners)
+
+    def board(self, k: int) -> int:
+        """The kth board to win, counting from 0 (or from the last with a
+        negative k). Boards winning on the same turn win in board order."""
+        if not -len(self.winners) <= k < len(self.winners):
+            raise IndexError(f"Expected fewer than {len(self.winners)} winners")
+        if k == 0:
+            return min(self.winners, key=self.win_turns.__getitem__)
+        if k == -1:
+            return max(reversed(self.winners), key=self.win_turns.__getitem__)
+        return sorted(self.winners, key=self.win_turns.__getitem__)[k]
+
+    def score(self, k: int) -> int:
+        """The score of the kth board to win."""
+        return self.score_board(self.board(k))
+
+    def score_board(self, board: int) -> int:
+        numbers, cells = self.bingo
+        turn = self.win_turns[board]
+        start = board * BOARD_CELLS
+        end = start + BOARD_CELLS
+        unmarked_sum = sum(
+            cell
+            for cell, cell_turn in zip(cells[start:end], self.cell_turns[start:end])
+            if cell_turn > turn
+        )
+        return unmarked_sum * numbers[turn]
+
+    def scores(self) -> list[int]:
+        """The scores of every board which wins, in the order they win."""
+        order = sorted(self.winners, key=self.win_turns.__getitem__)
+        return [self.score_board(board) for board in order]
+
+
+def find_first_winning_board_score(bingo: Bingo) -> int:
+    wins = BingoWins(bingo)
+    return wins.score(0) if wins else -1
+
+
+def find_last_winning_board_score(bingo: Bingo) -> int:
+    wins = BingoWins(bingo)
+    if not wins:
+        raise ValueError("Expected a board to win")
+    return wins.score(-1)
+
+
+def parse_input(f) -> Bingo:
+    with loader.map_input(f) as data:
+        first_line, _, rest = data[:].partition(b"\n")
+    numbers = list(loader.parse_int_array(first_line))
+    cells = loader.parse_int_array(rest)
+    if len(cells) % BOARD_CELLS:
+        raise ValueError(f"Expected boards of {SIZE} by {SIZE} numbers")
+    return Bingo(numbers, cells)
+
+
+def part_one(bingo: Bingo) -> int:
+    return find_first_winning_board_score(bingo)
+
+
+def part_two(bingo: Bingo) -> int:
+    return find_last_winning_board_score(bingo)
 
 
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input4.txt")) as f:
-        numbers, boards, boards_marks = parse_boards(f)
+        bingo = parse_input(f)
 
     print("Part One:")
-    print(find_first_winning_board_score(boards, boards_marks, numbers))
+    print(part_one(bingo))
 
     print("Part Two:")
-    print(find_last_winning_board_score(boards, boards_marks, numbers))
+    print(part_two(bingo))
@@ -1,17 +1,41 @@
 #!/usr/bin/env python3
+import math
 import os
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from collections.abc import Iterator
+from itertools import combinations
+from typing import Any
+
+from aoc import loader
 
 Coordinates = tuple[int, int]
+Interval = tuple[int, int]
+# The (a, b) for which the lines of a family are a * x + b * y == key
+Family = tuple[int, int]
+HORIZONTAL = (0, 1)
+VERTICAL = (1, 0)
+DIAGONAL = (1, -1)
+ANTIDIAGONAL = (1, 1)
+DIAGONALS = {DIAGONAL, ANTIDIAGONAL}
 
+# Sweep events at the same key are handled in this order, as intervals are
+# closed
+INSERT = 0
+QUERY = 1
+REMOVE = 2
 
-def parse_line_coordinates(f) -> list[tuple[Coordinates, Coordinates]]:
-    line_coordinates: list[tuple[Coordinates, Coordinates]] = []
-    for line in f:
-        coordinates_string = line.strip().split(" -> ")
-        x1, y1 = [int(c) for c in coordinates_string[0].split(",")]
-        x2, y2 = [int(c) for c in coordinates_string[1].split(",")]
-        line_coordinates.append(((x1, y1), (x2, y2)))
-    return line_coordinates
+# A byte per point, so this bounds the raster to 64 MiB
+MAX_RASTER_CELLS = 64 * 1024 * 1024
+# Counts saturate at 2 as only whether a point is covered twice matters
+INCREMENT_TABLE = bytes(min(count + 1, 2) for count in range(256))
+
+
+def parse_line(line: str) -> tuple[Coordinates, Coordinates]:
+    coordinates_string = line.strip().split(" -> ")
+    x1, y1 = [int(c) for c in coordinates_string[0].split(",")]
+    x2, y2 = [int(c) for c in coordinates_string[1].split(",")]
+    return (x1, y1), (x2, y2)
 
 
 def mark_line_coordinates(x: int, y: int, to_mark):
@@ -22,37 +46,287 @@ def mark_line_coordinates(x: int, y: int, to_mark):
         to_mark[(x, y)] = existing + 1
 
 
+def find_line_indices(
+    line: tuple[Coordinates, Coordinates], width: int, offset: int
+) -> range:
+    """The indices of the points on a horizontal, vertical or diagonal line
+    in a row-major raster of the given width, less offset. Every step along
+    the line moves the index by the same amount, so they form a range."""
+    (x1, y1), (x2, y2) = line
+    dx = (x2 > x1) - (x2 < x1)
+    dy = (y2 > y1) - (y2 < y1)
+    length = max(abs(x2 - x1), abs(y2 - y1)) + 1
+    start = y1 * width + x1 - offset
+    step = dy * width + dx
+    if step < 0:
+        # Walk the line from its other end, as slices ending before index 0
+        # cannot be written
+        start += (length - 1) * step
+        step = -step
+    elif step == 0:
+        step = 1
+    return range(start, start + length * step, step)
+
+
 def count_most_dangerous_areas(
     line_coordinates: list[tuple[Coordinates, Coordinates]],
     include_diagonal_lines: bool,
 ) -> int:
-    number_of_lines: dict[tuple[int, int], int] = {}
-    for (x1, y1), (x2, y2) in line_coordinates:
-        if x1 != x2 and y1 != y2:
-            if not include_diagonal_lines:
-                continue
-            xs = range(x1, x2 + 1) if x1 < x2 else range(x1, x2 - 1, -1)
-            ys = range(y1, y2 + 1) if y1 < y2 else range(y1, y2 - 1, -1)
-            for x, y in zip(xs, ys):
-                mark_line_coordinates(x, y, number_of_lines)
-        elif x1 == x2:
-            start, end = min(y1, y2), max(y1, y2)
-            for y in range(start, end + 1):
-                mark_line_coordinates(x1, y, number_of_lines)
+    """Count the points covered by at least two lines.
+
+    Each line is a strided slice of a raster of counts spanning the lines,
+    saturating at 2, so every line is marked with a single translate of its
+    slice rather than point by point. Lines spanning more than
+    MAX_RASTER_CELLS fall back to count_overlaps_by_sweep."""
+    lines = [
+        ((x1, y1), (x2, y2))
+        for (x1, y1), (x2, y2) in line_coordinates
+        if include_diagonal_lines or x1 == x2 or y1 == y2
+    ]
+    if not lines:
+        return 0
+
+    min_x = min(min(x1, x2) for (x1, _), (x2, _) in lines)
+    max_x = max(max(x1, x2) for (x1, _), (x2, _) in lines)
+    min_y = min(min(y1, y2) for (_, y1), (_, y2) in lines)
+    max_y = max(max(y1, y2) for (_, y1), (_, y2) in lines)
+    width = max_x - min_x + 1
+    height = max_y - min_y + 1
+    if width * height > MAX_RASTER_CELLS:
+        return count_overlaps_by_sweep(lines, include_diagonal_lines)
+
+    offset = min_y * width + min_x
+    raster = bytearray(width * height)
+    for indices in (find_line_indices(line, width, offset) for line in lines):
+        points = slice(indices.start, indices.stop, indices.step)
+        raster[points] = raster[points].translate(INCREMENT_TABLE)
+    return raster.count(2)
+
+
+def get_family(line: tuple[Coordinates, Coordinates]) -> Family:
+    (x1, y1), (x2, y2) = line
+    if y1 == y2:
+        return HORIZONTAL
+    if x1 == x2:
+        return VERTICAL
+    return DIAGONAL if (x2 > x1) == (y2 > y1) else ANTIDIAGONAL
+
+
+def get_key_and_position(family: Family, x: int, y: int) -> tuple[int, int]:
+    """The key of the family's line through (x, y) and the point's position
+    along it."""
+    a, b = family
+    return a * x + b * y, y if family == VERTICAL else x
+
+
+def get_point(family: Family, key: int, position: int) -> Coordinates:
+    if family == VERTICAL:
+        return key, position
+    a, b = family
+    # b is 1 or -1, so is its own reciprocal
+    return position, (key - a * position) * b
+
+
+def intersect(
+    family: Family, key: int, other_family: Family, other_key: int
+) -> Coordinates:
+    (a, b), (c, d) = family, other_family
+    determinant = a * d - b * c
+    return (
+        (key * d - b * other_key) // determinant,
+        (a * other_key - c * key) // determinant,
+    )
+
+
+def merge_intervals(intervals: list[Interval]) -> tuple[list[Interval], list[Interval]]:
+    """Merge the closed intervals on one line into their union and the
+    intervals covered at least twice, both sorted and disjoint.
+
+    In order of their starts, an interval overlaps the union of the intervals
+    before it from its start to the end of that union, and every point there
+    is covered twice."""
+    union: list[Interval] = []
+    doubles: list[Interval] = []
+    for start, end in sorted(intervals):
+        if not union or start > union[-1][1]:
+            union.append((start, end))
+            continue
+
+        union_start, union_end = union[-1]
+        double_end = min(end, union_end)
+        if doubles and start <= doubles[-1][1]:
+            doubles[-1] = (doubles[-1][0], max(doubles[-1][1], double_end))
         else:
-            start, end = min(x1, x2), max(x1, x2)
-            for x in range(start, end + 1):
-                mark_line_coordinates(x, y1, number_of_lines)
+            doubles.append((start, double_end))
+        union[-1] = (union_start, max(union_end, end))
+    return union, doubles
+
+
+def covers(intervals: list[Interval], position: int) -> bool:
+    i = bisect_right(intervals, (position, math.inf)) - 1
+    return i >= 0 and intervals[i][1] >= position
+
+
+def get_key_range(
+    family: Family, key: int, interval: Interval, other_family: Family
+) -> Interval:
+    """The range of keys of the other family's lines crossing an interval."""
+    start_key, _ = get_key_and_position(
+        other_family, *get_point(family, key, interval[0])
+    )
+    end_key, _ = get_key_and_position(
+        other_family, *get_point(family, key, interval[1])
+    )
+    return min(start_key, end_key), max(start_key, end_key)
+
+
+def find_crossings(
+    family: Family,
+    unions: dict[int, list[Interval]],
+    other_family: Family,
+    other_unions: dict[int, list[Interval]],
+) -> Iterator[Coordinates]:
+    """Find the lattice points where the lines covered by two families of
+    intervals cross, with a sweep over the first family's keys.
+
+    Each other interval spans a range of the first family's keys, and is held
+    in an ordered list of other keys while the sweep is within that range.
+    Each first interval spans a range of the other family's keys, and crosses
+    every interval held with one of those keys when the sweep reaches it.
+
+    The two diagonal families only cross at lattice points where their keys
+    have the same parity, so their other keys are held by parity."""
+    parities = 2 if {family, other_family} == DIAGONALS else 1
+
+    events: list[tuple[int, int, Any]] = []
+    for other_key, intervals in other_unions.items():
+        for interval in intervals:
+            low, high = get_key_range(other_family, other_key, interval, family)
+            events.append((low, INSERT, other_key))
+            events.append((high, REMOVE, other_key))
+    for key, intervals in unions.items():
+        for interval in intervals:
+            key_range = get_key_range(family, key, interval, other_family)
+            events.append((key, QUERY, key_range))
+    events.sort()
+
+    held: list[list[int]] = [[] for _ in range(parities)]
+    for key, event, value in events:
+        if event == INSERT:
+            insort(held[value % parities], value)
+        elif event == REMOVE:
+            other_keys = held[value % parities]
+            del other_keys[bisect_left(other_keys, value)]
+        else:
+            other_keys = held[key % parities]
+            low, high = value
+            for other_key in other_keys[
+                bisect_left(other_keys, low) : bisect_right(other_keys, high)
+            ]:
+                yield intersect(family, key, other_family, other_key)
+
+
+def count_overlaps_by_sweep(
+    line_coordinates: list[tuple[Coordinates, Coordinates]],
+    include_diagonal_lines: bool,
+) -> int:
+    """Count the points covered by at least two lines without visiting every
+    point, so coordinates can be arbitrarily large.
+
+    Lines are grouped into families of parallel lines, each line of a family
+    identified by a key, and the intervals on each line merged into their
+    union and the parts of it covered twice. A point is covered twice either
+    within a family, or by the unions of two families where they cross, so
+    the answer is the size of the doubles plus the crossings, less the
+    crossings which are also doubles."""
+    intervals: dict[Family, dict[int, list[Interval]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    for line in line_coordinates:
+        family = get_family(line)
+        if family in DIAGONALS and not include_diagonal_lines:
+            continue
+        (x1, y1), (x2, y2) = line
+        key, start = get_key_and_position(family, x1, y1)
+        _, end = get_key_and_position(family, x2, y2)
+        intervals[family][key].append((min(start, end), max(start, end)))
+
+    unions: dict[Family, dict[int, list[Interval]]] = {}
+    doubles: dict[Family, dict[int, list[Interval]]] = {}
+    for family, lines in intervals.items():
+        unions[family] = {}
+        doubles[family] = {}
+        for key, line_intervals in lines.items():
+            union, line_doubles = merge_intervals(line_intervals)
+            unions[family][key] = union
+            if line_doubles:
+                doubles[family][key] = line_doubles
+
+    count = sum(
+        end - start + 1
+        for lines in doubles.values()
+        for line_doubles in lines.values()
+        for start, end in line_doubles
+    )
+    crossings: set[Coordinates] = set()
+    for family, other_family in combinations(unions, 2):
+        crossings.update(
+            find_crossings(family, unions[family], other_family, unions[other_family])
+        )
+    count += len(crossings)
+    for x, y in crossings:
+        for family, lines in doubles.items():
+            key, position = get_key_and_position(family, x, y)
+            if key in lines and covers(lines[key], position):
+                count -= 1
+    return count
+
+
+def solve_stream(f) -> tuple[int, int]:
+    """Answer both parts in one pass over the lines of vents. Memory is
+    bounded by the area the vents cover rather than the number of lines."""
+    straight_number_of_lines: dict[tuple[int, int], int] = {}
+    number_of_lines: dict[tuple[int, int], int] = {}
+    for line in f:
+        if not line.strip():
+            continue
+        (x1, y1), (x2, y2) = parse_line(line)
+        dx = (x2 > x1) - (x2 < x1)
+        dy = (y2 > y1) - (y2 < y1)
+        is_straight = dx == 0 or dy == 0
+        for k in range(max(abs(x2 - x1), abs(y2 - y1)) + 1):
+            x, y = x1 + k * dx, y1 + k * dy
+            mark_line_coordinates(x, y, number_of_lines)
+            if is_straight:
+                mark_line_coordinates(x, y, straight_number_of_lines)
+
+    return (
+        sum(1 if v >= 2 else 0 for v in straight_number_of_lines.values()),
+        sum(1 if v >= 2 else 0 for v in number_of_lines.values()),
+    )
+
+
+def parse_input(f) -> list[tuple[Coordinates, Coordinates]]:
+    with loader.map_input(f) as data:
+        return [
+            ((x1, y1), (x2, y2)) for x1, y1, x2, y2 in loader.parse_records(data, 4)
+        ]
+
+
+def part_one(line_coordinates: list[tuple[Coordinates, Coordinates]]) -> int:
+    return count_most_dangerous_areas(line_coordinates, False)
+
 
-    return sum(1 if v >= 2 else 0 for (_, v) in number_of_lines.items())
+def part_two(line_coordinates: list[tuple[Coordinates, Coordinates]]) -> int:
+    return count_most_dangerous_areas(line_coordinates, True)
 
 
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input5.txt")) as f:
-        line_coordinates = parse_line_coordinates(f)
+        line_coordinates = parse_input(f)
 
     print("Part One:")
-    print(count_most_dangerous_areas(line_coordinates, False))
+    print(part_one(line_coordinates))
 
     print("Part Two:")
-    print(count_most_dangerous_areas(line_coordinates, True))
+    print(part_two(line_coordinates))
@@ -1,26 +1,175 @@
 #!/usr/bin/env python3
 import os
+from collections.abc import Iterable, Sequence
+from operator import mul
+
+from aoc import loader
+
+# Counts are ints unless some fish die, when they are expected values (and
+# may also be Fractions)
+Number = int | float
+Matrix = tuple[tuple[Number, ...], ...]
+
+
+def make_transition_matrix(
+    reset_timer: int, newborn_timer: int, survival_rate: Number = 1
+) -> Matrix:
+    """The matrix taking a day's counts of fish with each timer to the next
+    day's: entry (i, j) is the number of fish with timer i tomorrow for each
+    fish with timer j today."""
+    timers = max(reset_timer, newborn_timer) + 1
+    matrix: list[list[Number]] = [[0] * timers for _ in range(timers)]
+    for timer in range(1, timers):
+        matrix[timer - 1][timer] = survival_rate
+    matrix[reset_timer][0] += survival_rate
+    matrix[newborn_timer][0] += survival_rate
+    return tuple(map(tuple, matrix))
+
+
+def multiply(a: Matrix, b: Matrix, modulus: int | None = None) -> Matrix:
+    return tuple(multiply_vector(row, b, modulus) for row in a)
+
+
+def multiply_vector(
+    row: Sequence[Number], matrix: Matrix, modulus: int | None = None
+) -> tuple[Number, ...]:
+    product = (sum(map(mul, row, column)) for column in zip(*matrix))
+    if modulus is not None:
+        return tuple(x % modulus for x in product)
+    return tuple(product)
+
+
+class PopulationModel:
+    """Counts a population of fish which each spawn a new fish whenever their
+    timer passes 0, then restart at reset_timer while the new fish starts at
+    newborn_timer. Every fish survives each day with probability
+    survival_rate, which makes counts expected values when it is below 1.
+
+    Fish with the same timer behave identically, so the population is a count
+    per timer, advanced a day at a time by the transition matrix. The row of
+    how many fish each fish becomes after `days` days is the all ones row
+    times the days'th power of the matrix, found by multiplying the row by the
+    matrix's repeated squares for the set bits of days. The squares are
+    computed once and shared by every query, and each costs only a
+    vector-matrix product, so a batch of queries over many horizons needs
+    O(log max horizon) matrix products in all. A batch's rows are found
+    together in order of their horizons, each advancing the row before it by
+    the days between them, and are not kept once the batch is answered."""
+
+    def __init__(
+        self,
+        reset_timer: int = 6,
+        newborn_timer: int = 8,
+        survival_rate: Number = 1,
+    ) -> None:
+        if reset_timer < 0 or newborn_timer < 0:
+            raise ValueError("Expected non-negative timers")
+        if not 0 <= survival_rate <= 1:
+            raise ValueError("Expected a survival rate from 0 to 1")
+        self.timers = max(reset_timer, newborn_timer) + 1
+        self.survival_rate = survival_rate
+        self.transition = make_transition_matrix(
+            reset_timer, newborn_timer, survival_rate
+        )
+        self.squares: dict[int | None, list[Matrix]] = {}
+
+    def count_timers(self, timers: Sequence[int]) -> list[int]:
+        counts = [timers.count(timer) for timer in range(self.timers)]
+        if sum(counts) != len(timers):
+            raise ValueError(f"Expected timers from 0 to {self.timers - 1}")
+        return counts
+
+    def get_descendants(
+        self, days: int, modulus: int | None = None
+    ) -> tuple[Number, ...]:
+        """The number of fish each fish with each timer becomes after days."""
+        return self.get_descendants_batch([days], modulus)[days]
+
+    def get_descendants_batch(
+        self, horizons: Iterable[int], modulus: int | None = None
+    ) -> dict[int, tuple[Number, ...]]:
+        """The descendants of each fish after each of the horizons, by
+        horizon."""
+        ordered = sorted(set(horizons))
+        if ordered and ordered[0] < 0:
+            raise ValueError("Expected a non-negative number of days")
+        if modulus is not None and self.survival_rate != 1:
+            raise ValueError("Expected a survival rate of 1 when taking a modulus")
+
+        squares = self.squares.setdefault(modulus, [self.transition])
+        while ordered and len(squares) < ordered[-1].bit_length():
+            squares.append(multiply(squares[-1], squares[-1], modulus))
+        rows = {}
+        row: tuple[Number, ...] = (1,) * self.timers
+        previous = 0
+        for days in ordered:
+            step = days - previous
+            for i, square in enumerate(squares[: step.bit_length()]):
+                if step >> i & 1:
+                    row = multiply_vector(row, square, modulus)
+            rows[days] = row
+            previous = days
+        return rows
+
+    def count(
+        self, counts: Sequence[int], days: int, modulus: int | None = None
+    ) -> Number:
+        """Count the fish after days from the counts of fish with each timer,
+        optionally modulo modulus."""
+        total = sum(map(mul, self.get_descendants(days, modulus), counts))
+        return total if modulus is None else total % modulus
+
+    def count_batch(
+        self,
+        queries: Iterable[tuple[Sequence[int], int]],
+        modulus: int | None = None,
+    ) -> list[Number]:
+        """Answer (counts, days) queries together, finding the row for every
+        distinct horizon in one pass and sharing it between its queries."""
+        queries = list(queries)
+        rows = self.get_descendants_batch((days for _, days in queries), modulus)
+        totals = [sum(map(mul, rows[days], counts)) for counts, days in queries]
+        return totals if modulus is None else [total % modulus for total in totals]
+
+
+LANTERNFISH = PopulationModel()
+
+
+def count_timers(timers: Sequence[int]) -> list[int]:
+    return LANTERNFISH.count_timers(timers)
+
+
+def count_lanternfish(
+    counts: Sequence[int], days: int, modulus: int | None = None
+) -> int:
+    """Count the lanternfish after a number of days from the counts of fish
+    with each timer, optionally modulo modulus."""
+    return int(LANTERNFISH.count(counts, days, modulus))
 
 
 def number_of_lanternfish(target_n: int, target_t: int) -> int:
-    cache: dict[tuple[int, int], int] = {}
-    for n in range(9):
-        cache[(n, 0)] = 1
-    for t in range(1, target_t + 1):
-        for n in range(9):
-            if n == 0:
-                cache[(n, t)] = cache[(6, t - 1)] + cache[(8, t - 1)]
-            else:
-                cache[(n, t)] = cache[(n - 1, t - 1)]
-    return cache[(target_n, target_t)]
+    return int(LANTERNFISH.get_descendants(target_t)[target_n])
+
+
+def parse_input(f) -> Sequence[int]:
+    with loader.map_input(f) as data:
+        return loader.parse_int_array(data)
+
+
+def part_one(start: Sequence[int]) -> int:
+    return count_lanternfish(count_timers(start), 80)
+
+
+def part_two(start: Sequence[int]) -> int:
+    return count_lanternfish(count_timers(start), 256)
 
 
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input6.txt")) as f:
-        start = [int(x) for x in f.readline().split(",")]
+        start = parse_input(f)
 
     print("Part One:")
-    print(sum(number_of_lanternfish(n, 80) for n in start))
+    print(part_one(start))
 
     print("Part Two:")
-    print(sum(number_of_lanternfish(n, 256) for n in start))
+    print(part_two(start))
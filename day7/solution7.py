@@ -1,8 +1,78 @@
 #!/usr/bin/env python3
 import os
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Callable, Sequence
+from itertools import accumulate, repeat
+from operator import mul, sub
 
+from aoc import loader
+
+# Positions are only histogrammed when they span at most this many positions
+# per crab, so counting them stays O(n) in time and memory
+HISTOGRAM_RANGE_PER_CRAB = 4
+
+
+class CrabHistogram:
+    """The number of crabs at each position, as prefix sums over the positions
+    of the counts, of count * x and of count * x ** 2.
+
+    The fuel cost of aligning at any position then takes O(1): the crabs left
+    of it and right of it each contribute their count times the position less
+    the sum of their positions (or vice versa), and the sum of squared
+    distances expands to sum(x ** 2) - 2 * a * sum(x) + a ** 2 * n. So the cost
+    of every alignment is found in O(range) after an O(n) pass to count, and
+    the median is a bisect of the counts rather than a sort."""
+
+    def __init__(self, positions: Sequence[int]) -> None:
+        self.low = min(positions)
+        self.high = max(positions)
+        position_counts = Counter(positions)
+        xs = range(self.low, self.high + 1)
+        counts = list(map(position_counts.__getitem__, xs))
+        weighted = list(map(mul, counts, xs))
+        self.count_prefix = list(accumulate(counts, initial=0))
+        self.sum_prefix = list(accumulate(weighted, initial=0))
+        self.square_sum_prefix = list(accumulate(map(mul, weighted, xs), initial=0))
+
+    def __len__(self) -> int:
+        return self.count_prefix[-1]
+
+    def alignments(self) -> range:
+        return range(self.low, self.high + 1)
+
+    def select(self, k: int) -> int:
+        """The kth smallest position, counting from 0."""
+        if not 0 <= k < len(self):
+            raise IndexError(f"Expected k from 0 to {len(self) - 1}")
+        return self.low + bisect_right(self.count_prefix, k) - 1
+
+    def linear_cost(self, alignment: int) -> int:
+        """The sum of the distances of the crabs from alignment."""
+        i = min(max(alignment - self.low, 0), len(self.count_prefix) - 1)
+        left_count, left_sum = self.count_prefix[i], self.sum_prefix[i]
+        right_count = len(self) - left_count
+        right_sum = self.sum_prefix[-1] - left_sum
+        return alignment * (left_count - right_count) - left_sum + right_sum
+
+    def triangle_cost(self, alignment: int) -> int:
+        """The sum of the triangle numbers of the crabs' distances from
+        alignment, or half of the sum of their squares and themselves."""
+        total, square_total = self.sum_prefix[-1], self.square_sum_prefix[-1]
+        squares = square_total - 2 * alignment * total + alignment**2 * len(self)
+        return (squares + self.linear_cost(alignment)) // 2
+
+
+def fits_histogram(positions: Sequence[int]) -> bool:
+    return max(positions) - min(positions) <= HISTOGRAM_RANGE_PER_CRAB * len(positions)
+
+
+def calculate_fuel_cost_part_one(positions: Sequence[int]) -> float:
+    if fits_histogram(positions):
+        # Every alignment between the middle two positions is as good
+        histogram = CrabHistogram(positions)
+        return histogram.linear_cost(histogram.select((len(positions) - 1) // 2))
 
-def calculate_fuel_cost_part_one(positions: list[int]) -> float:
     median_position = median(positions)
     median_floor = int(median_position)
     median_ceil = int(median_position + 1)
@@ -12,15 +82,19 @@ def calculate_fuel_cost_part_one(positions: list[int]) -> float:
     )
 
 
-def median(xs: list[int]) -> float:
+def median(xs: Sequence[int]) -> float:
     sorted_xs = sorted(xs)
     return (sorted_xs[(len(sorted_xs) - 1) // 2] + sorted_xs[len(sorted_xs) // 2]) / 2
 
 
-def calculate_fuel_cost_part_two(positions: list[int]) -> int:
-    mean = sum(x for x in positions) / len(positions)
-    mean_floor = int(mean)
-    mean_ceil = int(mean + 1)
+def calculate_fuel_cost_part_two(positions: Sequence[int]) -> int:
+    if fits_histogram(positions):
+        histogram = CrabHistogram(positions)
+        return min(map(histogram.triangle_cost, histogram.alignments()))
+
+    # Floored, not truncated, so negative means round the same way
+    mean_floor = sum(positions) // len(positions)
+    mean_ceil = mean_floor + 1
     return min(
         sum(triangle_number(abs(x - mean_floor)) for x in positions),
         sum(triangle_number(abs(x - mean_ceil)) for x in positions),
@@ -31,12 +105,66 @@ def triangle_number(n: int) -> int:
     return n * (n + 1) // 2
 
 
+def quadratic(n: int) -> int:
+    return n * n
+
+
+def find_best_alignment(
+    positions: Sequence[int],
+    cost: Callable[[int], int],
+    weights: Sequence[int] | None = None,
+) -> tuple[int, int]:
+    """Find the alignment minimising the sum over the crabs of their weight
+    (1 by default) times the cost of their distance from it, and that sum.
+
+    The cost must be convex and non-decreasing in the distance (like abs,
+    triangle_number or quadratic), so the total is convex in the alignment
+    and the best alignment is the first whose cost does not exceed the next
+    one's. That is found with a binary search, evaluating the total cost
+    O(log range) times rather than at every candidate. Crabs at the same
+    position are evaluated together, in C-level iterator pipelines."""
+    position_weights: Counter[int] = Counter()
+    if weights is None:
+        position_weights.update(positions)
+    else:
+        for position, weight in zip(positions, weights):
+            position_weights[position] += weight
+    xs = list(position_weights)
+    ws = list(position_weights.values())
+
+    def total_cost(alignment: int) -> int:
+        distances = map(abs, map(sub, xs, repeat(alignment)))
+        return sum(map(mul, ws, map(cost, distances)))
+
+    low, high = min(positions), max(positions)
+    while low < high:
+        middle = (low + high) // 2
+        if total_cost(middle) <= total_cost(middle + 1):
+            high = middle
+        else:
+            low = middle + 1
+    return low, total_cost(low)
+
+
+def parse_input(f) -> Sequence[int]:
+    with loader.map_input(f) as data:
+        return loader.parse_int_array(data)
+
+
+def part_one(positions: Sequence[int]) -> int:
+    return int(calculate_fuel_cost_part_one(positions))
+
+
+def part_two(positions: Sequence[int]) -> int:
+    return calculate_fuel_cost_part_two(positions)
+
+
 if __name__ == "__main__":
     with open(os.path.join(os.path.dirname(__file__), "input7.txt")) as f:
-        positions = [int(x) for x in f.readline().strip().split(",")]
+        positions = parse_input(f)
 
     print("Part One:")
-    print(calculate_fuel_cost_part_one(positions))
+    print(part_one(positions))
 
     print("Part Two:")
-    print(calculate_fuel_cost_part_two(positions))
+    print(part_two(positions))
@@ -1,127 +1,132 @@
 #!/usr/bin/env python3
 import os
+from functools import cache
+from itertools import permutations
+
+from aoc import loader
+
+Entry = tuple[list[int], list[int]]
+
+# The segments are numbered by their bit in a pattern's mask, so a pattern is
+# a 7-bit int with a bit set per segment it turns on
+#
+#      0
+#   1     2
+#      3
+#   4     5
+#      6
+DIGIT_SEGMENTS = (
+    (0, 1, 2, 4, 5, 6),
+    (2, 5),
+    (0, 2, 3, 4, 6),
+    (0, 2, 3, 5, 6),
+    (1, 2, 3, 5),
+    (0, 1, 3, 5, 6),
+    (0, 1, 3, 4, 5, 6),
+    (0, 2, 5),
+    (0, 1, 2, 3, 4, 5, 6),
+    (0, 1, 2, 3, 5, 6),
+)
+# Unique segment counts for 1, 7, 4 and 8
+UNIQUE_SEGMENT_COUNTS = {2, 3, 4, 7}
+# The bit of the wire each character of a pattern names
+WIRE_BITS = [0] * 256
+for wire, c in enumerate(b"abcdefg"):
+    WIRE_BITS[c] = 1 << wire
+ENTRY_LENGTH = 15
+
+
+class PatternMasks(dict[bytes, int]):
+    """The masks of patterns, computed once per pattern. There are fewer than
+    14,000 orderings of every subset of the wires, so this stays small."""
+
+    def __missing__(self, pattern: bytes) -> int:
+        mask = self[pattern] = sum(map(WIRE_BITS.__getitem__, pattern))
+        return mask
+
+
+PATTERN_MASKS = PatternMasks()
+
+
+def parse_input(f) -> list[Entry]:
+    with loader.map_input(f) as data:
+        return parse_entries(data[:].split())
+
+
+def parse_line(line: str) -> Entry:
+    return parse_entries(line.encode().split())[0]
+
+
+def parse_entries(tokens: list[bytes]) -> list[Entry]:
+    """Parse entries of ten signal patterns, "|" and four output patterns
+    into the masks of their wires."""
+    entry_count = len(tokens) // ENTRY_LENGTH
+    if len(tokens) % ENTRY_LENGTH or tokens[10::ENTRY_LENGTH] != [b"|"] * entry_count:
+        raise ValueError("Expected ten signal patterns and four output patterns")
+    masks = list(map(PATTERN_MASKS.__getitem__, tokens))
+    return [
+        (masks[i : i + 10], masks[i + 11 : i + ENTRY_LENGTH])
+        for i in range(0, len(masks), ENTRY_LENGTH)
+    ]
 
 
-def parse_input(f) -> list[tuple[list[set[str]], list[set[str]]]]:
-    return [parse_line(line) for line in f]
-
-
-def parse_line(line) -> tuple[list[set[str]], list[set[str]]]:
-    left, right = line.strip().split(" | ")
-    signal_patterns = [make_segment_set(pattern) for pattern in left.split(" ")]
-    output_patterns = [make_segment_set(pattern) for pattern in right.split(" ")]
-    return signal_patterns, output_patterns
-
-
-def make_segment_set(pattern: str) -> set[str]:
-    return set(c for c in pattern)
+@cache
+def get_decoding_table() -> dict[frozenset[int], dict[int, int]]:
+    """Map the set of ten signal patterns produced by every possible wiring to
+    the digit each of those patterns displays.
 
+    Every wiring produces a different set of patterns, so the signal patterns
+    of an entry identify its wiring with a single lookup. There are only
+    7! = 5040 wirings, so the table is built once, on first use."""
+    table = {}
+    for wiring in permutations(range(7)):
+        digits = {
+            sum(1 << wiring[segment] for segment in segments): digit
+            for digit, segments in enumerate(DIGIT_SEGMENTS)
+        }
+        table[frozenset(digits)] = digits
+    return table
 
-def is_unique_segment_set(segment_set: set[str]) -> bool:
-    return (
-        len(segment_set) == 2  # Unique segment count for 1
-        or len(segment_set) == 4  # Unique segment count for 4
-        or len(segment_set) == 3  # Unique segment count for 7
-        or len(segment_set) == 7  # Unique segment count for 8
-    )
 
+def decode_output_value(signal_patterns: list[int], output_patterns: list[int]) -> int:
+    try:
+        digits = get_decoding_table()[frozenset(signal_patterns)]
+        output_value = 0
+        for pattern in output_patterns:
+            output_value = output_value * 10 + digits[pattern]
+    except KeyError:
+        raise ValueError("Expected the patterns of one wiring of the display")
+    return output_value
 
-def decode_patterns(signal_patterns: list[set[str]]) -> dict[str, str]:
-    """Decode which segment corresponds to which wire based on the ten unique
-    digit patterns.
 
-         u
-      ul   ur
-         m
-      dl   dr
-         d
+def count_unique_segment_counts(patterns: list[int]) -> int:
+    return sum(pattern.bit_count() in UNIQUE_SEGMENT_COUNTS for pattern in patterns)
 
-    Returns a mapping between the segment character and the wire position
-    according to the labelling in the diagram above.
-    """
-    one_pattern = next(p for p in signal_patterns if len(p) == 2)
-    four_pattern = next(p for p in signal_patterns if len(p) == 4)
-    seven_pattern = next(p for p in signal_patterns if len(p) == 3)
-    eight_pattern = next(p for p in signal_patterns if len(p) == 7)
 
-    u = next(c for c in seven_pattern if c not in one_pattern)
+def part_one(entries: list[Entry]) -> int:
+    return sum(
+        count_unique_segment_counts(output_patterns) for _, output_patterns in entries
+    )
 
-    ur_or_dr = list(one_pattern)
-    ul_or_m = list(four_pattern.difference(one_pattern))
-    dl_or_d = list(eight_pattern.difference(seven_pattern).difference(four_pattern))
 
-    two_three_five_patterns = [p for p in signal_patterns if len(p) == 5]
-    two_pattern = next(
-        p for p in two_three_five_patterns if all(c in p for c in dl_or_d)
-    )
-    three_pattern = next(
-        p for p in two_three_five_patterns if all(c in p for c in ur_or_dr)
-    )
-    five_pattern = next(
-        p for p in two_three_five_patterns if all(c in p for c in ul_or_m)
+def part_two(entries: list[Entry]) -> int:
+    return sum(
+        decode_output_value(signal_patterns, output_patterns)
+        for signal_patterns, output_patterns in entries
     )
 
-    if ur_or_dr[0] in two_pattern:
-        ur, dr = ur_or_dr[0], ur_or_dr[1]
-    else:
-        ur, dr = ur_or_dr[1], ur_or_dr[0]
-
-    if ul_or_m[0] in five_pattern and ul_or_m[0] not in three_pattern:
-        ul, m = ul_or_m[0], ul_or_m[1]
-    else:
-        ul, m = ul_or_m[1], ul_or_m[0]
-
-    if dl_or_d[0] in two_pattern and dl_or_d[0] not in three_pattern:
-        dl, d = dl_or_d[0], dl_or_d[1]
-    else:
-        dl, d = dl_or_d[1], dl_or_d[0]
-
-    return {
-        u: "u",
-        ul: "ul",
-        ur: "ur",
-        m: "m",
-        dl: "dl",
-        dr: "dr",
-        d: "d",
-    }
-
-
-def get_digit(decoded_pattern: frozenset[str]) -> int:
-    """Gets the digit corresponding to the decoded pattern following the
-    labelling in the diagram below.
-
-         u
-      ul   ur
-         m
-      dl   dr
-         d
-
-    Returns the digit between 0 and 9.
-    """
-    wire_mapping = {
-        frozenset(["u", "ul", "ur", "dl", "dr", "d"]): 0,
-        frozenset(["ur", "dr"]): 1,
-        frozenset(["u", "ur", "m", "dl", "d"]): 2,
-        frozenset(["u", "ur", "m", "dr", "d"]): 3,
-        frozenset(["ul", "ur", "m", "dr"]): 4,
-        frozenset(["u", "ul", "m", "dr", "d"]): 5,
-        frozenset(["u", "ul", "m", "dl", "dr", "d"]): 6,
-        frozenset(["u", "ur", "dr"]): 7,
-        frozenset(["u", "ul", "ur", "m", "dl", "dr", "d"]): 8,
-        frozenset(["u", "ul", "ur", "m", "dr", "d"]): 9,
-    }
-    return wire_mapping[decoded_pattern]
-
-
-def decode_output_value(
-    signal_patterns: list[set[str]], output_patterns: list[set[str]]
-) -> int:
-    segment_mapping = decode_patterns(signal_patterns)
-    decoded_digits = [
-        get_digit(frozenset(segment_mapping[c] for c in p)) for p in output_patterns
-    ]
-    return int("".join([str(digit) for digit in decoded_digits]))
+
+def solve_stream(f) -> tuple[int, int]:
+    """Answer both parts in one pass over the entries."""
+    unique_count = 0
+    output_value_sum = 0
+    for line in f:
+        if not line.strip():
+            continue
+        signal_patterns, output_patterns = parse_line(line)
+        unique_count += count_unique_segment_counts(output_patterns)
+        output_value_sum += decode_output_value(signal_patterns, output_patterns)
+    return unique_count, output_value_sum
 
 
 if __name__ == "__main__":
@@ -129,18 +134,7 @@ if __name__ == "__main__":
         entries = parse_input(f)
 
     print("Part One:")
-    print(
-        sum(
-            is_unique_segment_set(pattern)
-            for _, output_patterns in entries
-            for pattern in output_patterns
-        )
-    )
+    print(part_one(entries))
 
     print("Part Two:")
-    print(
-        sum(
-            decode_output_value(signal_patterns, output_patterns)
-            for signal_patterns, output_patterns in entries
-        )
-    )
+    print(part_two(entries))
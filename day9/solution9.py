@@ -1,67 +1,71 @@
 #!/usr/bin/env python3
 import os
 from math import prod
-from typing import Generator
 
+from aoc import loader
+from aoc.grid import Grid
 
-def parse_input(f) -> list[list[int]]:
-    return [[int(c) for c in line.strip()] for line in f]
 
+def parse_input(f) -> Grid:
+    with loader.map_input(f) as data:
+        return loader.parse_grid(data)
 
-def sum_risk_level(heightmap: list[list[int]]) -> int:
-    return sum(1 + heightmap[i][j] for (i, j) in find_low_points(heightmap))
 
+def sum_risk_level(heightmap: Grid) -> int:
+    return sum(1 + heightmap.cells[index] for index in find_low_points(heightmap))
 
-def find_basin_sizes(heightmap: list[list[int]]) -> dict[tuple[int, int], int]:
+
+def find_basin_sizes(heightmap: Grid) -> dict[int, int]:
     return {
         low_point: find_basin_size(heightmap, low_point)
         for low_point in find_low_points(heightmap)
     }
 
 
-def find_basin_size(heightmap: list[list[int]], low_point: tuple[int, int]) -> int:
-    m = len(heightmap)
-    n = len(heightmap[0])
-    basin: set[tuple[int, int]] = set([low_point])
-    to_visit: list[tuple[int, int]] = [low_point]
+def find_basin_size(heightmap: Grid, low_point: int) -> int:
+    heights = heightmap.cells
+    neighbors = heightmap.neighbors4
+    basin: set[int] = set([low_point])
+    to_visit: list[int] = [low_point]
     while to_visit:
-        i, j = to_visit.pop()
-        for x, y in get_neighbors(i, j, m, n):
+        index = to_visit.pop()
+        height = heights[index]
+        for neighbor in neighbors[index]:
+            neighbor_height = heights[neighbor]
             if (
-                heightmap[x][y] != 9
-                and heightmap[x][y] > heightmap[i][j]
-                and (x, y) not in basin
+                neighbor_height != 9
+                and neighbor_height > height
+                and neighbor not in basin
             ):
-                basin.add((x, y))
-                to_visit.append((x, y))
+                basin.add(neighbor)
+                to_visit.append(neighbor)
     return len(basin)
 
 
-def find_low_points(heightmap: list[list[int]]) -> list[tuple[int, int]]:
-    m = len(heightmap)
-    n = len(heightmap[0])
-    return [(i, j) for i in range(m) for j in range(n) if is_low_point(heightmap, i, j)]
+def find_low_points(heightmap: Grid) -> list[int]:
+    heights = heightmap.cells
+    neighbors = heightmap.neighbors4
+    return [
+        index
+        for index in range(len(heights))
+        if all(heights[neighbor] > heights[index] for neighbor in neighbors[index])
+    ]
 
 
-def is_low_point(heightmap: list[list[int]], i: int, j: int) -> bool:
-    m = len(heightmap)
-    n = len(heightmap[0])
-    return all(
-        heightmap[x][y] > heightmap[i][j] for (x, y) in get_neighbors(i, j, m, n)
-    )
+def part_one(heightmap: Grid) -> int:
+    return sum_risk_level(heightmap)
 
 
-def get_neighbors(
-    i: int, j: int, m: int, n: int
-) -> Generator[tuple[int, int], None, None]:
-    if i > 0:
-        yield i - 1, j
-    if j > 0:
-        yield i, j - 1
-    if i + 1 < m:
-        yield i + 1, j
-    if j + 1 < n:
-        yield i, j + 1
+def part_two(heightmap: Grid) -> int:
+    basin_sizes_by_low_point = find_basin_sizes(heightmap)
+    return prod(
+        basin_sizes_by_low_point[low_point]
+        for low_point in sorted(
+            basin_sizes_by_low_point,
+            key=lambda k: basin_sizes_by_low_point[k],
+            reverse=True,
+        )[:3]
+    )
 
 
 if __name__ == "__main__":
@@ -69,17 +73,7 @@ if __name__ == "__main__":
         heightmap = parse_input(f)
 
     print("Part One:")
-    print(sum_risk_level(heightmap))
+    print(part_one(heightmap))
 
-    basin_sizes_by_low_point = find_basin_sizes(heightmap)
     print("Part Two:")
-    print(
-        prod(
-            basin_sizes_by_low_point[low_point]
-            for low_point in sorted(
-                basin_sizes_by_low_point,
-                key=lambda k: basin_sizes_by_low_point[k],
-                reverse=True,
-            )[:3]
-        )
-    )
+    print(part_two(heightmap))